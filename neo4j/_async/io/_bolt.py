@@ -56,6 +56,29 @@ from ._common import (
 log = getLogger("neo4j")
 
 
+class _StateFlag:
+    """ Boolean connection-state attribute backed by a bit in `_state`.
+
+    Consolidating the state flags into a single int keeps all state
+    checks on one attribute (one cache line) instead of spreading them
+    over several instance attributes.
+    """
+
+    def __init__(self, flag):
+        self._flag = flag
+
+    def __get__(self, connection, owner=None):
+        if connection is None:
+            return False
+        return bool(connection._state & self._flag)
+
+    def __set__(self, connection, value):
+        if value:
+            connection._state |= self._flag
+        else:
+            connection._state &= ~self._flag
+
+
 class AsyncBolt:
     """ Server connection for Bolt protocol.
 
@@ -80,18 +103,21 @@ class AsyncBolt:
     # flag if connection needs RESET to go back to READY state
     is_reset = False
 
+    # consolidated connection-state bit field (see _StateFlag)
+    _state = 0
+
     # The socket
-    in_use = False
+    in_use = _StateFlag(0x1)
 
     # When the connection was last put back into the pool
     idle_since = float("-inf")
 
     # The socket
-    _closing = False
-    _closed = False
+    _closing = _StateFlag(0x2)
+    _closed = _StateFlag(0x4)
 
     # The socket
-    _defunct = False
+    _defunct = _StateFlag(0x8)
 
     #: The pool of which this connection is a member
     pool = None
@@ -139,10 +165,15 @@ class AsyncBolt:
             self.auth_dict = {}
         elif isinstance(auth, tuple) and 2 <= len(auth) <= 3:
             from neo4j import Auth
-            self.auth_dict = vars(Auth("basic", *auth))
+            auth = Auth("basic", *auth)
+            self.auth_dict = {k: v for k, v in vars(auth).items()
+                              if v is not None}
         else:
             try:
-                self.auth_dict = vars(auth)
+                # None-valued attributes mean "unset" and stay off the
+                # wire (Auth objects always carry the full shape)
+                self.auth_dict = {k: v for k, v in vars(auth).items()
+                                  if v is not None}
             except (KeyError, TypeError):
                 raise AuthError("Cannot determine auth details from %r" % auth)
 
@@ -722,7 +753,7 @@ class AsyncBolt:
                 or (0 <= self._max_connection_lifetime
                     <= perf_counter() - self._creation_timestamp))
 
-    _stale = False
+    _stale = _StateFlag(0x10)
 
     def set_stale(self):
         self._stale = True
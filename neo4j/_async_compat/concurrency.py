@@ -24,9 +24,11 @@ import threading
 
 __all__ = [
     "AsyncCondition",
+    "AsyncEvent",
     "AsyncLock",
     "AsyncRLock",
     "Condition",
+    "Event",
     "Lock",
     "RLock",
 ]
@@ -35,6 +37,22 @@ __all__ = [
 AsyncLock = asyncio.Lock
 
 
+class AsyncEvent(asyncio.Event):
+    """Asynchronous equivalent to threading.Event.
+
+    Adds support for `.wait(timeout)` to :class:`asyncio.Event`.
+    """
+
+    async def wait(self, timeout=None):
+        if timeout is None:
+            return await super().wait()
+        try:
+            await asyncio.wait_for(super().wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
 class AsyncRLock(asyncio.Lock):
     """Reentrant asyncio.lock
 
@@ -270,5 +288,6 @@ class AsyncCondition:
 
 
 Condition = threading.Condition
+Event = threading.Event
 Lock = threading.Lock
 RLock = threading.RLock
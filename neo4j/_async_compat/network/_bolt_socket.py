@@ -18,16 +18,16 @@
 
 import asyncio
 import logging
-import selectors
 import socket
-import struct
 from socket import (
     AF_INET,
     AF_INET6,
+    IPPROTO_TCP,
     SHUT_RDWR,
     SO_KEEPALIVE,
     socket,
     SOL_SOCKET,
+    TCP_NODELAY,
     timeout as SocketTimeout,
 )
 from ssl import (
@@ -57,6 +57,19 @@ from ._util import (
 
 log = logging.getLogger("neo4j")
 
+# resolved address tuple length -> socket family
+_ADDR_LEN_TO_FAMILY = {2: AF_INET, 4: AF_INET6}
+
+
+def _format_failed_connect(address, failed_addresses, errors):
+    # only called once the terminal ServiceUnavailable is raised
+    if not errors:
+        return "Couldn't connect to %s (resolved to %s)" % (
+            str(address), tuple(map(str, failed_addresses)))
+    return "Couldn't connect to %s (resolved to %s):\n%s" % (
+        str(address), tuple(map(str, failed_addresses)),
+        "\n".join(map(str, errors)))
+
 
 def _sanitize_deadline(deadline):
     if deadline is None:
@@ -67,34 +80,222 @@ def _sanitize_deadline(deadline):
     return deadline
 
 
+class _BoltBufferedProtocol(asyncio.BufferedProtocol):
+    """Receive protocol backed by a driver-owned buffer.
+
+    Unlike the stock :class:`asyncio.StreamReader` machinery, the transport
+    writes incoming data straight into this protocol's buffer
+    (``get_buffer``/``buffer_updated``). ``recv_into`` then costs a single
+    copy out of that buffer instead of a fresh ``bytes`` allocation plus
+    two copies per read.
+    """
+
+    _INITIAL_BUFFER_SIZE = 2 ** 16  # 64 KiB
+
+    def __init__(self, loop):
+        self._loop = loop
+        self._transport = None
+        self._buffer = bytearray(self._INITIAL_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        self._head = 0  # read cursor
+        self._tail = 0  # write cursor
+        self._eof = False
+        self._exception = None
+        self._connection_lost = False
+        self._read_waiter = None
+        self._drain_waiter = None
+        self._close_waiter = None
+        self._write_paused = False
+
+    def connection_made(self, transport):
+        self._transport = transport
+
+    def _make_room(self, sizehint):
+        head, tail = self._head, self._tail
+        filled = tail - head
+        needed = filled + sizehint
+        if len(self._buffer) < needed:
+            # Grow geometrically so that large server responses don't
+            # trigger a re-allocation per read event. The unread bytes
+            # move straight into the new buffer; no separate compaction.
+            new_size = len(self._buffer)
+            while new_size < needed:
+                new_size *= 2
+            new_buffer = bytearray(new_size)
+            new_buffer[:filled] = self._view[head:tail]
+            self._view.release()
+            self._buffer = new_buffer
+            self._view = memoryview(new_buffer)
+        elif head:
+            # Compact: move the unread bytes to the front. Slicing the
+            # bytearray first makes the overlapping copy safe.
+            self._buffer[:filled] = self._buffer[head:tail]
+        self._head, self._tail = 0, filled
+
+    def get_buffer(self, sizehint):
+        if sizehint < 1:
+            sizehint = 1
+        if len(self._buffer) - self._tail < sizehint:
+            self._make_room(sizehint)
+        return self._view[self._tail:]
+
+    def buffer_updated(self, nbytes):
+        self._tail += nbytes
+        self._wake_read_waiter()
+
+    def eof_received(self):
+        self._eof = True
+        self._wake_read_waiter()
+        return False
+
+    def connection_lost(self, exc):
+        self._exception = exc
+        self._eof = True
+        self._connection_lost = True
+        self._wake_read_waiter()
+        waiter = self._drain_waiter
+        self._drain_waiter = None
+        if waiter is not None and not waiter.done():
+            if exc is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(exc)
+        waiter = self._close_waiter
+        self._close_waiter = None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _wake_read_waiter(self):
+        waiter = self._read_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def pause_writing(self):
+        self._write_paused = True
+
+    def resume_writing(self):
+        self._write_paused = False
+        waiter = self._drain_waiter
+        self._drain_waiter = None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def wait_for_data(self):
+        while self._head == self._tail and not self._eof:
+            self._read_waiter = self._loop.create_future()
+            try:
+                await self._read_waiter
+            finally:
+                self._read_waiter = None
+        if (self._head == self._tail
+                and self._exception is not None):
+            raise self._exception
+
+    def read(self, nbytes):
+        """Return up to ``nbytes`` already-received bytes."""
+        head = self._head
+        n = min(self._tail - head, nbytes)
+        data = bytes(self._view[head:head + n])
+        self._advance(n)
+        return data
+
+    def read_into(self, buffer, nbytes):
+        """Copy up to ``nbytes`` already-received bytes into ``buffer``."""
+        head = self._head
+        n = min(self._tail - head, nbytes, len(buffer))
+        if n:
+            buffer[:n] = self._view[head:head + n]
+            self._advance(n)
+        return n
+
+    def _advance(self, n):
+        head = self._head + n
+        if head == self._tail:
+            # buffer fully drained; rewind so get_buffer never compacts
+            self._head = self._tail = 0
+        else:
+            self._head = head
+
+    async def drain(self):
+        if self._exception is not None:
+            raise self._exception
+        if not self._write_paused:
+            return
+        self._drain_waiter = self._loop.create_future()
+        await self._drain_waiter
+
+    async def wait_closed(self):
+        if self._connection_lost:
+            return
+        self._close_waiter = self._loop.create_future()
+        await self._close_waiter
+
+
 class AsyncBoltSocket:
+    __slots__ = (
+        "_protocol", "_transport", "_timeout", "_deadline", "_deadline_at",
+    )
+
     Bolt = None
 
-    def __init__(self, reader, protocol, writer):
-        self._reader = reader  # type: asyncio.StreamReader
-        self._protocol = protocol  # type: asyncio.StreamReaderProtocol
-        self._writer = writer  # type: asyncio.StreamWriter
+    _HANDSHAKE_PAYLOAD = None  # lazily built, see _prep_handshake_cache
+
+    @classmethod
+    def _prep_handshake_cache(cls):
+        # Everything here is deterministic per Bolt class; compute it once
+        # instead of on every connect.
+        handshake = cls.Bolt.get_handshake()
+        cls._HANDSHAKE_VERSIONS = [
+            handshake[i:i + 4] for i in range(0, len(handshake), 4)
+        ]
+        cls._SUPPORTED_VERSION_STRS = [
+            # iterating bytes yields ints, so %02X formatting still applies
+            "0x%02X%02X%02X%02X" % tuple(vx)
+            for vx in cls._HANDSHAKE_VERSIONS
+        ]
+        cls._MAGIC_INT = int.from_bytes(cls.Bolt.MAGIC_PREAMBLE,
+                                        byteorder="big")
+        cls._HANDSHAKE_PAYLOAD = cls.Bolt.MAGIC_PREAMBLE + handshake
+
+    def __init__(self, protocol, transport):
+        self._protocol = protocol  # type: _BoltBufferedProtocol
+        self._transport = transport  # type: asyncio.Transport
         # 0 - non-blocking
         # None infinitely blocking
         # int - seconds to wait for data
         self._timeout = None
         self._deadline = None
+        self._deadline_at = None
 
     async def _wait_for_io(self, io_fut):
         timeout = self._timeout
+        deadline_at = self._deadline_at
+        if timeout is None and deadline_at is None:
+            # no timeout to enforce; skip wait_for's extra task and timer
+            return await io_fut
         to_raise = SocketTimeout
-        if self._deadline is not None:
-            deadline_timeout = self._deadline.to_timeout()
+        if deadline_at is not None:
+            deadline_timeout = deadline_at - perf_counter()
             if deadline_timeout <= 0:
                 raise SocketDeadlineExceeded("timed out")
             if timeout is None or deadline_timeout <= timeout:
                 timeout = deadline_timeout
                 to_raise = SocketDeadlineExceeded
 
-        if timeout is not None and timeout <= 0:
-            # give the io-operation time for one loop cycle to do its thing
-            io_fut = asyncio.create_task(io_fut)
+        if timeout <= 0:
+            # give the io-operation time for one loop cycle to do its
+            # thing, then either take its result or call it off without
+            # going through wait_for's timer machinery
+            task = asyncio.ensure_future(io_fut)
             await asyncio.sleep(0)
+            if task.done():
+                return task.result()
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            raise to_raise("timed out")
         try:
             return await asyncio.wait_for(io_fut, timeout)
         except asyncio.TimeoutError as e:
@@ -104,20 +305,27 @@ class AsyncBoltSocket:
         return self._deadline
 
     def set_deadline(self, deadline):
-        self._deadline = _sanitize_deadline(deadline)
+        deadline = _sanitize_deadline(deadline)
+        self._deadline = deadline
+        # flatten to a plain perf_counter value so that _wait_for_io
+        # doesn't need a method call per I/O operation
+        if deadline is None:
+            self._deadline_at = None
+        else:
+            self._deadline_at = perf_counter() + deadline.to_timeout()
 
     @property
     def _socket(self) -> socket:
-        return self._writer.transport.get_extra_info("socket")
+        return self._transport.get_extra_info("socket")
 
     def getsockname(self):
-        return self._writer.transport.get_extra_info("sockname")
+        return self._transport.get_extra_info("sockname")
 
     def getpeername(self):
-        return self._writer.transport.get_extra_info("peername")
+        return self._transport.get_extra_info("peername")
 
     def getpeercert(self, *args, **kwargs):
-        return self._writer.transport.get_extra_info("ssl_object")\
+        return self._transport.get_extra_info("ssl_object")\
             .getpeercert(*args, **kwargs)
 
     def gettimeout(self):
@@ -131,24 +339,26 @@ class AsyncBoltSocket:
             self._timeout = timeout
 
     async def recv(self, n):
-        io_fut = self._reader.read(n)
-        return await self._wait_for_io(io_fut)
+        await self._wait_for_io(self._protocol.wait_for_data())
+        return self._protocol.read(n)
 
     async def recv_into(self, buffer, nbytes):
-        # FIXME: not particularly memory or time efficient
-        io_fut = self._reader.read(nbytes)
-        res = await self._wait_for_io(io_fut)
-        buffer[:len(res)] = res
-        return len(res)
+        await self._wait_for_io(self._protocol.wait_for_data())
+        return self._protocol.read_into(buffer, nbytes)
 
     async def sendall(self, data):
-        self._writer.write(data)
-        io_fut = self._writer.drain()
-        return await self._wait_for_io(io_fut)
+        self._transport.write(data)
+        return await self._wait_for_io(self._protocol.drain())
+
+    async def sendall_many(self, chunks):
+        # vectored write: all chunks are handed to the transport in one
+        # go with a single drain cycle instead of one per sendall call
+        self._transport.writelines(chunks)
+        return await self._wait_for_io(self._protocol.drain())
 
     async def close(self):
-        self._writer.close()
-        await self._writer.wait_closed()
+        self._transport.close()
+        await self._protocol.wait_closed()
 
     @classmethod
     async def _connect_secure(cls, resolved_address, timeout, keep_alive, ssl):
@@ -162,27 +372,15 @@ class AsyncBoltSocket:
         :return: AsyncBoltSocket object
         """
 
-        loop = asyncio.get_event_loop()
-        s = None
+        loop = asyncio.get_running_loop()
 
-        # TODO: tomorrow me: fix this mess
         try:
-            if len(resolved_address) == 2:
-                s = socket(AF_INET)
-            elif len(resolved_address) == 4:
-                s = socket(AF_INET6)
-            else:
+            try:
+                family = _ADDR_LEN_TO_FAMILY[len(resolved_address)]
+            except KeyError:
                 raise ValueError(
-                    "Unsupported address {!r}".format(resolved_address))
-            s.setblocking(False)  # asyncio + blocking = no-no!
-            log.debug("[#0000]  C: <OPEN> %s", resolved_address)
-            await asyncio.wait_for(
-                loop.sock_connect(s, resolved_address),
-                timeout
-            )
-
-            keep_alive = 1 if keep_alive else 0
-            s.setsockopt(SOL_SOCKET, SO_KEEPALIVE, keep_alive)
+                    "Unsupported address {!r}".format(resolved_address)
+                ) from None
 
             ssl_kwargs = {}
 
@@ -192,15 +390,31 @@ class AsyncBoltSocket:
                     ssl=ssl, server_hostname=hostname if HAS_SNI else None
                 )
 
-            reader = asyncio.StreamReader(
-                limit=2 ** 16,  # 64 KiB,
-                loop=loop
-            )
-            protocol = asyncio.StreamReaderProtocol(reader, loop=loop)
-            transport, _ = await loop.create_connection(
-                lambda: protocol, sock=s, **ssl_kwargs
+            log.debug("[#0000]  C: <OPEN> %s", resolved_address)
+            protocol = _BoltBufferedProtocol(loop)
+            # Connect the raw socket with the full sockaddr so IPv6
+            # flowinfo/scope id survive (host/port arguments would drop
+            # them), then hand it to create_connection, which performs
+            # the TLS handshake if requested. The address is already
+            # resolved, so no name resolution happens here.
+            s = socket(family)
+            try:
+                s.setblocking(False)
+
+                async def connect():
+                    await loop.sock_connect(s, resolved_address)
+                    return await loop.create_connection(
+                        lambda: protocol, sock=s, **ssl_kwargs
+                    )
+
+                transport, _ = await asyncio.wait_for(connect(), timeout)
+            except Exception:
+                s.close()
+                raise
+
+            transport.get_extra_info("socket").setsockopt(
+                SOL_SOCKET, SO_KEEPALIVE, 1 if keep_alive else 0
             )
-            writer = asyncio.StreamWriter(transport, protocol, reader, loop)
 
             if ssl is not None:
                 # Check that the server provides a certificate
@@ -208,34 +422,32 @@ class AsyncBoltSocket:
                     transport.get_extra_info("ssl_object").getpeercert(
                         binary_form=True)
                 if der_encoded_server_certificate is None:
-                    local_port = s.getsockname()[1]
+                    local_port = transport.get_extra_info("sockname")[1]
                     raise BoltProtocolError(
                         "When using an encrypted socket, the server should "
                         "always provide a certificate",
                         address=(resolved_address.host_name, local_port)
                     )
 
-            return cls(reader, protocol, writer)
+            return cls(protocol, transport)
 
         except asyncio.TimeoutError:
-            log.debug("[#0000]  C: <TIMEOUT> %s", resolved_address)
-            log.debug("[#0000]  C: <CLOSE> %s", resolved_address)
-            if s:
-                await cls.close_socket(s)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[#0000]  C: <TIMEOUT> %s", resolved_address)
+                log.debug("[#0000]  C: <CLOSE> %s", resolved_address)
             raise ServiceUnavailable(
                 "Timed out trying to establish connection to {!r}".format(
                     resolved_address))
         except (SSLError, CertificateError) as error:
-            local_port = s.getsockname()[1]
             raise BoltSecurityError(
                 message="Failed to establish encrypted connection.",
-                address=(resolved_address.host_name, local_port)
+                address=(resolved_address.host_name, 0)
             ) from error
         except OSError as error:
-            log.debug("[#0000]  C: <ERROR> %s %s", type(error).__name__,
-                      " ".join(map(repr, error.args)))
-            log.debug("[#0000]  C: <CLOSE> %s", resolved_address)
-            s.close()
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[#0000]  C: <ERROR> %s %s", type(error).__name__,
+                          " ".join(map(repr, error.args)))
+                log.debug("[#0000]  C: <CLOSE> %s", resolved_address)
             raise ServiceUnavailable(
                 "Failed to establish connection to {!r} (reason {})".format(
                     resolved_address, error))
@@ -250,22 +462,19 @@ class AsyncBoltSocket:
         """
         local_port = self.getsockname()[1]
 
-        # TODO: Optimize logging code
-        handshake = self.Bolt.get_handshake()
-        handshake = struct.unpack(">16B", handshake)
-        handshake = [handshake[i:i + 4] for i in range(0, len(handshake), 4)]
-
-        supported_versions = [
-            ("0x%02X%02X%02X%02X" % (vx[0], vx[1], vx[2], vx[3])) for vx in
-            handshake]
+        if self._HANDSHAKE_PAYLOAD is None:
+            self._prep_handshake_cache()
+        handshake = self._HANDSHAKE_VERSIONS
 
-        log.debug("[#%04X]  C: <MAGIC> 0x%08X", local_port,
-                  int.from_bytes(self.Bolt.MAGIC_PREAMBLE, byteorder="big"))
-        log.debug("[#%04X]  C: <HANDSHAKE> %s %s %s %s", local_port,
-                  *supported_versions)
+        if log.isEnabledFor(logging.DEBUG):
+            # one record for both lines; each log call takes the logging
+            # lock and walks the handlers separately
+            log.debug("[#%04X]  C: <MAGIC> 0x%08X <HANDSHAKE> %s %s %s %s",
+                      local_port, self._MAGIC_INT,
+                      *self._SUPPORTED_VERSION_STRS)
 
-        data = self.Bolt.MAGIC_PREAMBLE + self.Bolt.get_handshake()
-        await self.sendall(data)
+        self._transport.write(self._HANDSHAKE_PAYLOAD)
+        await self._wait_for_io(self._protocol.drain())
 
         # Handle the handshake response
         original_timeout = self.gettimeout()
@@ -340,15 +549,17 @@ class AsyncBoltSocket:
                 )
                 return await s._handshake(resolved_address)
             except (BoltError, DriverError, OSError) as error:
-                try:
-                    local_port = s.getsockname()[1]
-                except (OSError, AttributeError, TypeError):
-                    local_port = 0
-                err_str = error.__class__.__name__
-                if str(error):
-                    err_str += ": " + str(error)
-                log.debug("[#%04X]  C: <CONNECTION FAILED> %s", local_port,
-                          err_str)
+                if log.isEnabledFor(logging.DEBUG):
+                    try:
+                        local_port = s.getsockname()[1]
+                    except (OSError, AttributeError, TypeError):
+                        local_port = 0
+                    err_msg = str(error)
+                    err_str = error.__class__.__name__
+                    if err_msg:
+                        err_str += ": " + err_msg
+                    log.debug("[#%04X]  C: <CONNECTION FAILED> %s",
+                              local_port, err_str)
                 if s:
                     await cls.close_socket(s)
                 errors.append(error)
@@ -359,24 +570,47 @@ class AsyncBoltSocket:
                 raise
         if not errors:
             raise ServiceUnavailable(
-                "Couldn't connect to %s (resolved to %s)" % (
-                    str(address), tuple(map(str, failed_addresses)))
+                _format_failed_connect(address, failed_addresses, errors)
             )
         else:
             raise ServiceUnavailable(
-                "Couldn't connect to %s (resolved to %s):\n%s" % (
-                    str(address), tuple(map(str, failed_addresses)),
-                    "\n".join(map(str, errors))
-                )
+                _format_failed_connect(address, failed_addresses, errors)
             ) from errors[0]
 
 
 class BoltSocket:
+    # the delegate methods are bound per instance in the _socket setter,
+    # hence their slots; the name-mangled slot backs the _socket property
+    __slots__ = (
+        "_BoltSocket__socket", "_deadline", "_deadline_at", "getsockname",
+        "getpeername", "getpeercert", "gettimeout", "settimeout",
+    )
+
     Bolt = None
 
+    _HANDSHAKE_PAYLOAD = None  # lazily built, see _prep_handshake_cache
+
+    @classmethod
+    def _prep_handshake_cache(cls):
+        # Everything here is deterministic per Bolt class; compute it once
+        # instead of on every connect.
+        handshake = cls.Bolt.get_handshake()
+        cls._HANDSHAKE_VERSIONS = [
+            handshake[i:i + 4] for i in range(0, len(handshake), 4)
+        ]
+        cls._SUPPORTED_VERSION_STRS = [
+            # iterating bytes yields ints, so %02X formatting still applies
+            "0x%02X%02X%02X%02X" % tuple(vx)
+            for vx in cls._HANDSHAKE_VERSIONS
+        ]
+        cls._MAGIC_INT = int.from_bytes(cls.Bolt.MAGIC_PREAMBLE,
+                                        byteorder="big")
+        cls._HANDSHAKE_PAYLOAD = cls.Bolt.MAGIC_PREAMBLE + handshake
+
     def __init__(self, socket_: socket):
         self._socket = socket_
         self._deadline = None
+        self._deadline_at = None
 
     @property
     def _socket(self):
@@ -395,10 +629,11 @@ class BoltSocket:
         self.settimeout = socket_.settimeout
 
     def _wait_for_io(self, func, *args, **kwargs):
-        if self._deadline is None:
+        deadline_at = self._deadline_at
+        if deadline_at is None:
             return func(*args, **kwargs)
         timeout = self._socket.gettimeout()
-        deadline_timeout = self._deadline.to_timeout()
+        deadline_timeout = deadline_at - perf_counter()
         if deadline_timeout <= 0:
             raise SocketDeadlineExceeded("timed out")
         if timeout is None or deadline_timeout <= timeout:
@@ -415,7 +650,14 @@ class BoltSocket:
         return self._deadline
 
     def set_deadline(self, deadline):
-        self._deadline = _sanitize_deadline(deadline)
+        deadline = _sanitize_deadline(deadline)
+        self._deadline = deadline
+        # flatten to a plain perf_counter value so that _wait_for_io
+        # doesn't need a method call per I/O operation
+        if deadline is None:
+            self._deadline_at = None
+        else:
+            self._deadline_at = perf_counter() + deadline.to_timeout()
 
     def recv(self, n):
         return self._wait_for_io(self._socket.recv, n)
@@ -443,13 +685,12 @@ class BoltSocket:
         s = None  # The socket
 
         try:
-            if len(resolved_address) == 2:
-                s = socket(AF_INET)
-            elif len(resolved_address) == 4:
-                s = socket(AF_INET6)
-            else:
+            try:
+                s = socket(_ADDR_LEN_TO_FAMILY[len(resolved_address)])
+            except KeyError:
                 raise ValueError(
-                    "Unsupported address {!r}".format(resolved_address))
+                    "Unsupported address {!r}".format(resolved_address)
+                ) from None
             t = s.gettimeout()
             if timeout:
                 s.settimeout(timeout)
@@ -458,18 +699,24 @@ class BoltSocket:
             s.settimeout(t)
             keep_alive = 1 if keep_alive else 0
             s.setsockopt(SOL_SOCKET, SO_KEEPALIVE, keep_alive)
+            # asyncio disables Nagle's algorithm by default; do the same
+            # here so small writes (handshake, single messages) don't get
+            # delayed in the kernel
+            s.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
             return s
         except SocketTimeout:
-            log.debug("[#0000]  C: <TIMEOUT> %s", resolved_address)
-            log.debug("[#0000]  C: <CLOSE> %s", resolved_address)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[#0000]  C: <TIMEOUT> %s", resolved_address)
+                log.debug("[#0000]  C: <CLOSE> %s", resolved_address)
             cls.close_socket(s)
             raise ServiceUnavailable(
                 "Timed out trying to establish connection to {!r}".format(
                     resolved_address))
         except OSError as error:
-            log.debug("[#0000]  C: <ERROR> %s %s", type(error).__name__,
-                      " ".join(map(repr, error.args)))
-            log.debug("[#0000]  C: <CLOSE> %s", resolved_address)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[#0000]  C: <ERROR> %s %s", type(error).__name__,
+                          " ".join(map(repr, error.args)))
+                log.debug("[#0000]  C: <CLOSE> %s", resolved_address)
             s.close()
             raise ServiceUnavailable(
                 "Failed to establish connection to {!r} (reason {})".format(
@@ -510,34 +757,31 @@ class BoltSocket:
         """
         local_port = s.getsockname()[1]
 
-        # TODO: Optimize logging code
-        handshake = cls.Bolt.get_handshake()
-        handshake = struct.unpack(">16B", handshake)
-        handshake = [handshake[i:i + 4] for i in range(0, len(handshake), 4)]
+        if cls._HANDSHAKE_PAYLOAD is None:
+            cls._prep_handshake_cache()
+        handshake = cls._HANDSHAKE_VERSIONS
 
-        supported_versions = [
-            ("0x%02X%02X%02X%02X" % (vx[0], vx[1], vx[2], vx[3])) for vx in
-            handshake]
+        if log.isEnabledFor(logging.DEBUG):
+            # one record for both lines; each log call takes the logging
+            # lock and walks the handlers separately
+            log.debug("[#%04X]  C: <MAGIC> 0x%08X <HANDSHAKE> %s %s %s %s",
+                      local_port, cls._MAGIC_INT,
+                      *cls._SUPPORTED_VERSION_STRS)
 
-        log.debug("[#%04X]  C: <MAGIC> 0x%08X", local_port,
-                  int.from_bytes(cls.Bolt.MAGIC_PREAMBLE, byteorder="big"))
-        log.debug("[#%04X]  C: <HANDSHAKE> %s %s %s %s", local_port,
-                  *supported_versions)
-
-        data = cls.Bolt.MAGIC_PREAMBLE + cls.Bolt.get_handshake()
-        s.sendall(data)
+        s.sendall(cls._HANDSHAKE_PAYLOAD)
 
         # Handle the handshake response
-        ready_to_read = False
-        with selectors.DefaultSelector() as selector:
-            selector.register(s, selectors.EVENT_READ)
-            selector.select(1)
+        original_timeout = s.gettimeout()
+        if original_timeout is not None:
+            s.settimeout(original_timeout + 1)
         try:
             data = s.recv(4)
         except OSError:
             raise ServiceUnavailable(
                 "Failed to read any data from server {!r} "
                 "after connected".format(resolved_address))
+        finally:
+            s.settimeout(original_timeout)
         data_size = len(data)
         if data_size == 0:
             # If no data is returned after a successful select
@@ -583,6 +827,7 @@ class BoltSocket:
         assuming a protocol version can be agreed.
         """
         errors = []
+        failed_addresses = []
         # Establish a connection to the host and port specified
         # Catches refused connections see:
         # https://docs.python.org/2/library/errno.html
@@ -598,31 +843,30 @@ class BoltSocket:
                                        ssl_context)
                 return BoltSocket._handshake(s, resolved_address)
             except (BoltError, DriverError, OSError) as error:
-                try:
-                    local_port = s.getsockname()[1]
-                except (OSError, AttributeError):
-                    local_port = 0
-                err_str = error.__class__.__name__
-                if str(error):
-                    err_str += ": " + str(error)
-                log.debug("[#%04X]  C: <CONNECTION FAILED> %s", local_port,
-                          err_str)
+                if log.isEnabledFor(logging.DEBUG):
+                    try:
+                        local_port = s.getsockname()[1]
+                    except (OSError, AttributeError):
+                        local_port = 0
+                    err_msg = str(error)
+                    err_str = error.__class__.__name__
+                    if err_msg:
+                        err_str += ": " + err_msg
+                    log.debug("[#%04X]  C: <CONNECTION FAILED> %s",
+                              local_port, err_str)
                 if s:
                     BoltSocket.close_socket(s)
                 errors.append(error)
+                failed_addresses.append(resolved_address)
             except Exception:
                 if s:
                     BoltSocket.close_socket(s)
                 raise
         if not errors:
             raise ServiceUnavailable(
-                "Couldn't connect to %s (resolved to %s)" % (
-                    str(address), tuple(map(str, resolved_addresses)))
+                _format_failed_connect(address, failed_addresses, errors)
             )
         else:
             raise ServiceUnavailable(
-                "Couldn't connect to %s (resolved to %s):\n%s" % (
-                    str(address), tuple(map(str, resolved_addresses)),
-                    "\n".join(map(str, errors))
-                )
+                _format_failed_connect(address, failed_addresses, errors)
             ) from errors[0]
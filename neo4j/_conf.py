@@ -16,13 +16,11 @@
 # limitations under the License.
 
 
+import ssl
 from abc import ABCMeta
 from collections.abc import Mapping
 
-from ._meta import (
-    deprecation_warn,
-    get_user_agent,
-)
+from ._meta import deprecation_warn
 from .api import (
     DEFAULT_DATABASE,
     TRUST_ALL_CERTIFICATES,
@@ -155,12 +153,29 @@ class ConfigType(ABCMeta):
                       or isinstance(v, (staticmethod, classmethod))):
                 fields.append(k)
 
+        # all key sets are fixed once the class is built; computing them
+        # here makes keys() & co. constant-time instead of allocating a
+        # fresh set per call
+        keys_frozen = frozenset(fields)
+        deprecated_keys_frozen = (frozenset(deprecated_aliases)
+                                  | frozenset(deprecated_alternatives))
+        all_keys_frozen = keys_frozen | deprecated_keys_frozen
+
+        # raw attributes for internal fast paths; the classmethods below
+        # stay as the public face
+        attributes.setdefault("_keys_frozen", keys_frozen)
+        attributes.setdefault("_deprecated_keys_frozen",
+                              deprecated_keys_frozen)
+        attributes.setdefault("_all_keys_frozen", all_keys_frozen)
+
         def keys(_):
-            return set(fields)
+            return keys_frozen
 
         def _deprecated_keys(_):
-            return (set(deprecated_aliases.keys())
-                    | set(deprecated_alternatives.keys()))
+            return deprecated_keys_frozen
+
+        def _all_keys(_):
+            return all_keys_frozen
 
         def _get_new(_, key):
             return deprecated_aliases.get(
@@ -178,15 +193,17 @@ class ConfigType(ABCMeta):
                               classmethod(_get_new))
         attributes.setdefault("_deprecated_keys",
                               classmethod(_deprecated_keys))
+        attributes.setdefault("_all_keys",
+                              classmethod(_all_keys))
         attributes.setdefault("_deprecated_aliases",
                               classmethod(_deprecated_aliases))
         attributes.setdefault("_deprecated_alternatives",
                               classmethod(_deprecated_alternatives))
 
-        return super(ConfigType, mcs).__new__(
-            mcs, name, bases, {k: v for k, v in attributes.items()
-                               if k not in _deprecated_keys(None)}
-        )
+        if deprecated_keys_frozen:
+            attributes = {k: v for k, v in attributes.items()
+                          if k not in deprecated_keys_frozen}
+        return super(ConfigType, mcs).__new__(mcs, name, bases, attributes)
 
 
 class Config(Mapping, metaclass=ConfigType):
@@ -213,23 +230,26 @@ class Config(Mapping, metaclass=ConfigType):
     def _consume(cls, data):
         config = {}
         if data:
-            for key in cls.keys() | cls._deprecated_keys():
-                try:
-                    value = data.pop(key)
-                except KeyError:
-                    pass
-                else:
-                    config[key] = value
+            # one set intersection instead of a try/except per known key
+            for key in cls._all_keys_frozen & data.keys():
+                config[key] = data.pop(key)
         return cls(config)
 
     def __update(self, data):
-        data_dict = dict(iter_items(data))
+        # plain dicts (the usual case) are only read from, no need to copy
+        data_dict = data if type(data) is dict else dict(iter_items(data))
+        cls = type(self)
+        keys = cls._keys_frozen
+        deprecated_keys = cls._deprecated_keys_frozen
+        aliases = cls._deprecated_aliases()
+        alternatives = cls._deprecated_alternatives()
 
         def set_attr(k, v):
-            if k in self.keys():
+            if k in keys:
                 setattr(self, k, v)
-            elif k in self._deprecated_keys():
-                k0 = self._get_new(k)
+            elif k in deprecated_keys:
+                alternative = alternatives.get(k)
+                k0 = aliases[k] if alternative is None else alternative[0]
                 if k0 in data_dict:
                     raise ConfigurationError(
                         "Cannot specify both '{}' and '{}' in config"
@@ -239,16 +259,20 @@ class Config(Mapping, metaclass=ConfigType):
                     "The '{}' config key is deprecated, please use '{}' "
                     "instead".format(k, k0)
                 )
-                if k in self._deprecated_aliases():
+                if alternative is None:
                     set_attr(k0, v)
-                else:  # k in self._deprecated_alternatives:
-                    _, converter = self._deprecated_alternatives()[k]
-                    converter(self, v)
+                else:
+                    alternative[1](self, v)
             else:
                 raise AttributeError(k)
 
         for key, value in data_dict.items():
-            if value is not None:
+            if value is None:
+                continue
+            if key in keys:
+                # overwhelmingly the common case; skip the closure call
+                setattr(self, key, value)
+            else:
                 set_attr(key, value)
 
     def __init__(self, *args, **kwargs):
@@ -263,13 +287,13 @@ class Config(Mapping, metaclass=ConfigType):
         return "<%s%s>" % (self.__class__.__name__, "".join(attrs))
 
     def __len__(self):
-        return len(self.keys())
+        return len(self._keys_frozen)
 
     def __getitem__(self, key):
         return getattr(self, key)
 
     def __iter__(self):
-        return iter(self.keys())
+        return iter(self._keys_frozen)
 
 
 def _trust_to_trusted_certificates(pool_config, trust):
@@ -332,8 +356,11 @@ class PoolConfig(Config):
     # The use of this option is strongly discouraged.
 
     #: User Agent (Python Driver Specific)
-    user_agent = get_user_agent()
+    user_agent = None
     # Specify the client agent name.
+    # None means the driver will generate the default user agent lazily
+    # when the connection is established (see Bolt.__init__), keeping the
+    # computation off the import path.
 
     #: Protocol Version (Python Driver Specific)
     protocol_version = None  # Version(4, 0)
@@ -347,6 +374,10 @@ class PoolConfig(Config):
     keep_alive = True
     # Specify whether TCP keep-alive should be enabled.
 
+    # memoized result of get_ssl_context; the config is effectively
+    # immutable once the driver is constructed
+    _ssl_context_cache = None
+
     def get_ssl_context(self):
         if self.ssl_context is not None:
             return self.ssl_context
@@ -354,7 +385,8 @@ class PoolConfig(Config):
         if not self.encrypted:
             return None
 
-        import ssl
+        if self._ssl_context_cache is not None:
+            return self._ssl_context_cache
 
         # SSL stands for Secure Sockets Layer and was originally created by Netscape.
         # SSLv2 and SSLv3 are the 2 versions of this protocol (SSLv1 was never publicly released).
@@ -393,6 +425,7 @@ class PoolConfig(Config):
             # work on Windows with system CAs.
             ssl_context.load_default_certs()
 
+        self._ssl_context_cache = ssl_context
         return ssl_context
 
 
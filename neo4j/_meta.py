@@ -17,7 +17,10 @@
 
 
 import asyncio
-from functools import wraps
+from functools import (
+    lru_cache,
+    wraps,
+)
 from warnings import warn
 
 
@@ -26,6 +29,7 @@ package = "neo4j"
 version = "5.0.dev0"
 
 
+@lru_cache(maxsize=1)
 def get_user_agent():
     """ Obtain the default user agent string sent to the server after
     a successful handshake.
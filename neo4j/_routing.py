@@ -60,6 +60,11 @@ class OrderedSet(MutableSet):
         except KeyError:
             pass
 
+    def difference_update(self, elements):
+        pop = self._elements.pop
+        for element in elements:
+            pop(element, None)
+
     def remove(self, element):
         try:
             del self._elements[element]
@@ -69,6 +74,14 @@ class OrderedSet(MutableSet):
     def update(self, elements=()):
         self._elements.update(dict.fromkeys(elements))
 
+    def without(self, element):
+        """ Iterate over all members except the given one.
+
+        Unlike set difference, this neither materializes an intermediate
+        set nor loses the insertion order.
+        """
+        return (e for e in self._elements if e != element)
+
     def replace(self, elements=()):
         e = self._elements
         e.clear()
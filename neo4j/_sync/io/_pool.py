@@ -25,9 +25,11 @@ from collections import (
 from contextlib import contextmanager
 from logging import getLogger
 from random import choice
+from time import perf_counter
 
 from ..._async_compat.concurrency import (
-    Condition,
+    Event,
+    Lock,
     RLock,
 )
 from ..._async_compat.network import NetworkUtil
@@ -76,10 +78,31 @@ class IOPool(abc.ABC):
         self.opener = opener
         self.pool_config = pool_config
         self.workspace_config = workspace_config
-        self.connections = defaultdict(deque)
-        self.connections_reservations = defaultdict(lambda: 0)
-        self.lock = RLock()
-        self.cond = Condition(self.lock)
+        self.free_connections = defaultdict(deque)
+        self.in_use_connections = defaultdict(set)
+        self.connections_reservations = {}
+        # per-address locks (sharded to keep acquires to different
+        # addresses from contending with each other) plus a small
+        # structural lock that only guards creating new shards
+        self._structural_lock = Lock()
+        self._addr_locks = {}
+        self._addr_events = {}
+        # bumped on deactivate so that a batched health check that raced
+        # a deactivation knows to drop its drained connections
+        self._addr_deactivations = {}
+
+    def _address_lock_event(self, address):
+        """ Get (lazily creating) the lock/slot-event shard for an address.
+        """
+        try:
+            return self._addr_locks[address], self._addr_events[address]
+        except KeyError:
+            pass
+        with self._structural_lock:
+            if address not in self._addr_locks:
+                self._addr_locks[address] = Lock()
+                self._addr_events[address] = Event()
+            return self._addr_locks[address], self._addr_events[address]
 
     def __enter__(self):
         return self
@@ -87,24 +110,57 @@ class IOPool(abc.ABC):
     def __exit__(self, exc_type, exc_value, traceback):
         self.close()
 
-    def _acquire_from_pool(self, address):
-        with self.lock:
-            for connection in list(self.connections.get(address, [])):
-                if connection.in_use:
-                    continue
-                connection.pool = self
-                connection.in_use = True
-                return connection
-        return None  # no free connection available
+    def _health_check(self, connection, deadline,
+                            liveness_check_timeout):
+        if (connection.closed()
+                or connection.defunct()
+                or connection.stale()):
+            return False
+        if liveness_check_timeout is not None:
+            if connection.is_idle_for(liveness_check_timeout):
+                with connection_deadline(connection, deadline):
+                    try:
+                        connection.reset()
+                    except (OSError, ServiceUnavailable, SessionExpired):
+                        return False
+        return True
 
     def _acquire_from_pool_checked(
-        self, address, health_check, deadline
+        self, address, deadline, liveness_check_timeout
     ):
-        while not deadline.expired():
-            connection = self._acquire_from_pool(address)
-            if not connection:
+        # Synchronous fast-path check: if there's no free connection,
+        # there's nothing to pop, so don't bother awaiting the lock at
+        # all. A connection released concurrently is picked up by the
+        # caller's wait-and-retry loop, just as it would have been had
+        # it been released right after the locked section below.
+        if not self.free_connections.get(address):
+            return None
+        lock, event = self._address_lock_event(address)
+        with lock:
+            # Drain the whole free list in one locked operation; unhealthy
+            # connections are then culled in a single batch instead of
+            # paying one lock round trip per candidate. While the drained
+            # connections are being checked, they are accounted as in-use
+            # so that concurrent acquires don't overshoot the pool size.
+            candidates = self.free_connections.pop(address, None)
+            if not candidates:
                 return None  # no free connection available
-            if not health_check(connection, deadline):
+            self.in_use_connections[address].update(candidates)
+            deactivations = self._addr_deactivations.get(address, 0)
+        acquired = None
+        culled = []
+        try:
+            while candidates and not deadline.expired():
+                # LIFO: the most recently released connection is the most
+                # likely to still have warm caches (TCP buffers, TLS state).
+                connection = candidates.pop()
+                if self._health_check(
+                    connection, deadline, liveness_check_timeout
+                ):
+                    connection.pool = self
+                    connection.in_use = True
+                    acquired = connection
+                    break
                 # `close` is a noop on already closed connections.
                 # This is to make sure that the connection is
                 # gracefully closed, e.g. if it's just marked as
@@ -118,22 +174,56 @@ class IOPool(abc.ABC):
                         connection.stale(), connection.in_use
                     )
                 connection.close()
-                with self.lock:
-                    try:
-                        self.connections.get(address, []).remove(connection)
-                    except ValueError:
-                        # If closure fails (e.g. because the server went
-                        # down), all connections to the same address will
-                        # be removed. Therefore, we silently ignore if the
-                        # connection isn't in the pool anymore.
-                        pass
-                continue  # try again with a new connection
-            else:
-                return connection
+                culled.append(connection)
+        finally:
+            with lock:
+                in_use_connections = self.in_use_connections[address]
+                # If closure fails (e.g. because the server went down),
+                # all connections to the same address will be removed.
+                # Therefore, we use `discard` to silently ignore if a
+                # connection isn't in the pool anymore.
+                for connection in culled:
+                    in_use_connections.discard(connection)
+                # The address was deactivated while the drained
+                # connections were being checked. deactivate couldn't see
+                # them, so they (winner included) must be dropped here.
+                drop_drained = (
+                    self._addr_deactivations.get(address, 0) != deactivations
+                )
+                if drop_drained:
+                    for connection in candidates:
+                        in_use_connections.discard(connection)
+                    if acquired:
+                        in_use_connections.discard(acquired)
+                elif candidates:
+                    # put unchecked candidates back where they came from
+                    for connection in candidates:
+                        in_use_connections.discard(connection)
+                    self.free_connections[address].extendleft(
+                        reversed(candidates)
+                    )
+                    event.set()
+            if drop_drained:
+                for connection in candidates:
+                    connection.close()
+                if acquired:
+                    acquired.close()
+                    acquired = None
+        return acquired
+
+    def _release_reservation(self, address):
+        # Caller must hold the address lock.
+        remaining = self.connections_reservations[address] - 1
+        if remaining:
+            self.connections_reservations[address] = remaining
+        else:
+            del self.connections_reservations[address]
 
     def _acquire_new_later(self, address, deadline):
+        # Caller must hold the address lock. The lock is not (and must not
+        # be) acquired here; it's not reentrant.
         def connection_creator():
-            released_reservation = False
+            connection = None
             try:
                 try:
                     connection = self.opener(
@@ -144,26 +234,27 @@ class IOPool(abc.ABC):
                     raise
                 connection.pool = self
                 connection.in_use = True
-                with self.lock:
-                    self.connections_reservations[address] -= 1
-                    released_reservation = True
-                    self.connections[address].append(connection)
                 return connection
             finally:
-                if not released_reservation:
-                    with self.lock:
-                        self.connections_reservations[address] -= 1
+                # One short locked section per completion, success or
+                # failure: turn the reservation into a pool entry (or just
+                # drop it if the opener failed).
+                lock, _ = self._address_lock_event(address)
+                with lock:
+                    self._release_reservation(address)
+                    if connection is not None:
+                        self.in_use_connections[address].add(connection)
 
         max_pool_size = self.pool_config.max_connection_pool_size
         infinite_pool_size = (max_pool_size < 0
                               or max_pool_size == float("inf"))
-        with self.lock:
-            connections = self.connections[address]
-            pool_size = (len(connections)
-                         + self.connections_reservations[address])
-            can_create_new_connection = (infinite_pool_size
-                                         or pool_size < max_pool_size)
-            self.connections_reservations[address] += 1
+        reserved = self.connections_reservations.get(address, 0)
+        pool_size = (len(self.free_connections[address])
+                     + len(self.in_use_connections[address])
+                     + reserved)
+        can_create_new_connection = (infinite_pool_size
+                                     or pool_size < max_pool_size)
+        self.connections_reservations[address] = reserved + 1
         if can_create_new_connection:
             return connection_creator
         return None
@@ -175,46 +266,37 @@ class IOPool(abc.ABC):
 
         This method is thread safe.
         """
-        def health_check(connection_, deadline_):
-            if (connection_.closed()
-                    or connection_.defunct()
-                    or connection_.stale()):
-                return False
-            if liveness_check_timeout is not None:
-                if connection_.is_idle_for(liveness_check_timeout):
-                    with connection_deadline(connection_, deadline_):
-                        try:
-                            connection_.reset()
-                        except (OSError, ServiceUnavailable, SessionExpired):
-                            return False
-            return True
-
         while True:
             # try to find a free connection in the pool
             connection = self._acquire_from_pool_checked(
-                address, health_check, deadline
+                address, deadline, liveness_check_timeout
             )
             if connection:
                 return connection
             # all connections in pool are in-use
-            with self.lock:
+            lock, event = self._address_lock_event(address)
+            with lock:
                 connection_creator = self._acquire_new_later(
                     address, deadline
                 )
                 if connection_creator:
                     break
-
-                # failed to obtain a connection from pool because the
-                # pool is full and no free connection in the pool
-                timeout = deadline.to_timeout()
-                if (
-                    timeout == 0  # deadline expired
-                    or not self.cond.wait(timeout)
-                ):
-                    raise ClientError(
-                        "failed to obtain a connection from the pool within "
-                        "{!r}s (timeout)".format(deadline.original_timeout)
-                    )
+                # Clear the slot event while holding the lock so that a
+                # release between the check above and the wait below is
+                # guaranteed to be observed.
+                event.clear()
+
+            # failed to obtain a connection from pool because the
+            # pool is full and no free connection in the pool
+            timeout = deadline.to_timeout()
+            if (
+                timeout == 0  # deadline expired
+                or not event.wait(timeout)
+            ):
+                raise ClientError(
+                    "failed to obtain a connection from the pool within "
+                    "{!r}s (timeout)".format(deadline.original_timeout)
+                )
         return connection_creator()
 
     @abc.abstractmethod
@@ -236,58 +318,62 @@ class IOPool(abc.ABC):
         """ Release a connection back into the pool.
         This method is thread safe.
         """
-        with self.lock:
-            for connection in connections:
-                if not (connection.defunct()
-                        or connection.closed()
-                        or connection.is_reset):
-                    try:
-                        connection.reset()
-                    except (Neo4jError, DriverError, BoltError) as e:
-                        log.debug(
-                            "Failed to reset connection on release: %s", e
-                        )
+        # Reset the connections outside the lock: it's connection I/O that
+        # doesn't touch the pool's state and may (on failure) re-enter the
+        # pool to deactivate the address.
+        for connection in connections:
+            if not (connection.defunct()
+                    or connection.closed()
+                    or connection.is_reset):
+                try:
+                    connection.reset()
+                except (Neo4jError, DriverError, BoltError) as e:
+                    log.debug(
+                        "Failed to reset connection on release: %s", e
+                    )
+        for connection in connections:
+            address = connection.unresolved_address
+            lock, event = self._address_lock_event(address)
+            with lock:
                 connection.in_use = False
-            self.cond.notify_all()
+                in_use_connections = self.in_use_connections[address]
+                if connection in in_use_connections:
+                    in_use_connections.remove(connection)
+                    self.free_connections[address].append(connection)
+                # signal that a slot opened up on this address
+                event.set()
 
     def in_use_connection_count(self, address):
         """ Count the number of connections currently in use to a given
         address.
         """
-        try:
-            connections = self.connections[address]
-        except KeyError:
-            return 0
-        else:
-            return sum(1 if connection.in_use else 0 for connection in connections)
+        return len(self.in_use_connections.get(address, ()))
 
     def mark_all_stale(self):
-        with self.lock:
-            for address in self.connections:
-                for connection in self.connections[address]:
+        addresses = set(self.free_connections) | set(self.in_use_connections)
+        for address in addresses:
+            lock, _ = self._address_lock_event(address)
+            with lock:
+                for connection in self.free_connections.get(address, ()):
+                    connection.set_stale()
+                for connection in self.in_use_connections.get(address, ()):
                     connection.set_stale()
 
     def deactivate(self, address):
         """ Deactivate an address from the connection pool, if present, closing
         all idle connection to that address
         """
-        with self.lock:
-            try:
-                connections = self.connections[address]
-            except KeyError:  # already removed from the connection pool
-                return
-            closable_connections = [
-                conn for conn in connections if not conn.in_use
-            ]
-            # First remove all connections in question, then try to close them.
-            # If closing of a connection fails, we will end up in this method
-            # again.
-            for conn in closable_connections:
-                connections.remove(conn)
-            for conn in closable_connections:
-                conn.close()
-            if not self.connections[address]:
-                del self.connections[address]
+        lock, _ = self._address_lock_event(address)
+        with lock:
+            # First remove all connections in question, then try to close
+            # them. If closing of a connection fails, we will end up in this
+            # method again.
+            closable_connections = self.free_connections.pop(address, ())
+            self._addr_deactivations[address] = (
+                self._addr_deactivations.get(address, 0) + 1
+            )
+        for conn in closable_connections:
+            conn.close()
 
     def on_write_failure(self, address):
         raise WriteServiceUnavailable(
@@ -299,10 +385,21 @@ class IOPool(abc.ABC):
         This method is thread safe.
         """
         try:
-            with self.lock:
-                for address in list(self.connections):
-                    for connection in self.connections.pop(address, ()):
-                        connection.close()
+            addresses = (set(self.free_connections)
+                         | set(self.in_use_connections))
+            # Only hold the locks long enough to detach the connections
+            # from the pool; the actual closing (connection I/O that may
+            # stall on the network) happens outside any lock.
+            connections = []
+            for address in addresses:
+                lock, _ = self._address_lock_event(address)
+                with lock:
+                    connections.extend(self.free_connections.pop(address, ()))
+                    connections.extend(
+                        self.in_use_connections.pop(address, ())
+                    )
+            for connection in connections:
+                connection.close()
         except TypeError:
             pass
 
@@ -396,6 +493,15 @@ class Neo4jPool(IOPool):
         self.address = address
         self.routing_tables = {workspace_config.database: RoutingTable(database=workspace_config.database, routers=[address])}
         self.refresh_lock = RLock()
+        # Caches resolved router addresses for a short while so that
+        # routing storms don't hammer DNS; keyed by the unresolved router
+        # address, invalidated on deactivate.
+        self._resolve_cache = {}
+        # Caches until when a routing table was last known to be fresh,
+        # keyed by (database, readonly). As long as the cache entry holds,
+        # acquire() skips the refresh lock (and the freshness check under
+        # it) entirely.
+        self._fresh_until = {}
 
     def __repr__(self):
         """ The representation shows the initial routing addresses.
@@ -546,6 +652,29 @@ class Neo4jPool(IOPool):
         # At least one of each is fine, so return this table
         return new_routing_table
 
+    # how long resolved router addresses may be reused before hitting
+    # DNS again
+    _resolve_cache_ttl = 30.0
+
+    def _resolve_addresses_cached(self, router):
+        """ Resolve a router address, caching the result for a short while.
+        """
+        now = perf_counter()
+        cached = self._resolve_cache.get(router)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        addresses = [
+            address
+            for address in NetworkUtil.resolve_address(
+                router, resolver=self.pool_config.resolver
+            )
+        ]
+        with self._structural_lock:
+            self._resolve_cache[router] = (
+                now + self._resolve_cache_ttl, addresses
+            )
+        return addresses
+
     def _update_routing_table_from(
         self, *routers, database, imp_user, bookmarks, deadline,
         database_callback
@@ -555,13 +684,11 @@ class Neo4jPool(IOPool):
         :return: True if the routing table is successfully updated,
         otherwise False
         """
-        log.debug("Attempting to update routing table from {}".format(
-            ", ".join(map(repr, routers)))
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Attempting to update routing table from %s",
+                      ", ".join(map(repr, routers)))
         for router in routers:
-            for address in NetworkUtil.resolve_address(
-                router, resolver=self.pool_config.resolver
-            ):
+            for address in self._resolve_addresses_cached(router):
                 if deadline.expired():
                     return False
                 new_routing_table = self.fetch_routing_table(
@@ -575,10 +702,12 @@ class Neo4jPool(IOPool):
                         new_database
                     )
                     old_routing_table.update(new_routing_table)
-                    log.debug(
-                        "[#0000]  C: <UPDATE ROUTING TABLE> address=%r (%r)",
-                        address, self.routing_tables[new_database]
-                    )
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug(
+                            "[#0000]  C: <UPDATE ROUTING TABLE> "
+                            "address=%r (%r)",
+                            address, self.routing_tables[new_database]
+                        )
                     if callable(database_callback):
                         database_callback(new_database)
                     return True
@@ -611,8 +740,13 @@ class Neo4jPool(IOPool):
         )
         with self._refresh_lock_deadline(deadline):
             routing_table = self.get_or_create_routing_table(database)
-            # copied because it can be modified
-            existing_routers = set(routing_table.routers)
+            # copied (one ordered pass, no intermediate set) because it can
+            # be modified while the update attempts below are running
+            existing_routers = tuple(
+                routing_table.routers.without(
+                    self.first_initial_routing_address
+                )
+            )
 
             prefer_initial_routing_address = \
                 self.routing_tables[database].initialized_without_writers
@@ -627,7 +761,7 @@ class Neo4jPool(IOPool):
                     # Why is only the first initial routing address used?
                     return
             if self._update_routing_table_from(
-                *(existing_routers - {self.first_initial_routing_address}),
+                *existing_routers,
                 database=database, imp_user=imp_user, bookmarks=bookmarks,
                 deadline=deadline, database_callback=database_callback
             ):
@@ -647,12 +781,22 @@ class Neo4jPool(IOPool):
             log.error("Unable to retrieve routing information")
             raise ServiceUnavailable("Unable to retrieve routing information")
 
+    def mark_all_stale(self):
+        self._fresh_until.clear()
+        super().mark_all_stale()
+
     def update_connection_pool(self, *, database):
         routing_table = self.get_or_create_routing_table(database)
         servers = routing_table.servers()
-        for address in list(self.connections):
+        addresses = set(self.free_connections) | set(self.in_use_connections)
+        # Bind the base-class deactivate once instead of building a super
+        # object (and walking the MRO) for every address. The override on
+        # this class must be bypassed: it would also prune the routing
+        # table that was just refreshed.
+        deactivate = super(Neo4jPool, self).deactivate
+        for address in addresses:
             if address.unresolved not in servers:
-                super(Neo4jPool, self).deactivate(address)
+                deactivate(address)
 
     def ensure_routing_table_is_fresh(
         self, *, access_mode, database, imp_user, bookmarks, deadline=None,
@@ -670,11 +814,27 @@ class Neo4jPool(IOPool):
 
         :return: `True` if an update was required, `False` otherwise.
         """
-        from neo4j.api import READ_ACCESS
+        readonly = access_mode == READ_ACCESS
+        # Refreshes are idempotent: whichever task wins the lock satisfies
+        # everybody else's freshness requirement. A waiter that would only
+        # re-discover freshness therefore doesn't need to join the lock's
+        # waiter queue at all — check before acquiring, then again after.
+        routing_table = self.routing_tables.get(database)
+        if (routing_table is not None
+                and routing_table.is_fresh(readonly=readonly)):
+            self._fresh_until[(database, readonly)] = (
+                perf_counter() + min(routing_table.ttl, 1.0)
+            )
+            return False
         with self._refresh_lock_deadline(deadline):
             routing_table = self.get_or_create_routing_table(database)
-            if routing_table.is_fresh(readonly=(access_mode == READ_ACCESS)):
-                # Readers are fresh.
+            if routing_table.is_fresh(readonly=readonly):
+                # Readers are fresh. Remember this for a bit so that
+                # subsequent acquires don't need to take the refresh lock
+                # at all.
+                self._fresh_until[(database, readonly)] = (
+                    perf_counter() + min(routing_table.ttl, 1.0)
+                )
                 return False
 
             self.update_routing_table(
@@ -686,7 +846,9 @@ class Neo4jPool(IOPool):
             for database in list(self.routing_tables.keys()):
                 # Remove unused databases in the routing table
                 # Remove the routing table after a timeout = TTL + 30s
-                log.debug("[#0000]  C: <ROUTING AGED> database=%s", database)
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("[#0000]  C: <ROUTING AGED> database=%s",
+                              database)
                 if (self.routing_tables[database].should_be_purged_from_memory()
                         and database != self.workspace_config.database):
                     del self.routing_tables[database]
@@ -694,7 +856,6 @@ class Neo4jPool(IOPool):
             return True
 
     def _select_address(self, *, access_mode, database):
-        from ...api import READ_ACCESS
         """ Selects the address with the fewest in-use connections.
         """
         with self.refresh_lock:
@@ -702,12 +863,20 @@ class Neo4jPool(IOPool):
                 addresses = self.routing_tables[database].readers
             else:
                 addresses = self.routing_tables[database].writers
-            addresses_by_usage = {}
+            # Single pass over the candidates, tracking the current minimum
+            # and its ties as we go. This runs on every routed acquire, so
+            # attribute lookups are hoisted out of the loop.
+            in_use_connections = self.in_use_connections.get
+            least_usage = None
+            least_used = []
             for address in addresses:
-                addresses_by_usage.setdefault(
-                    self.in_use_connection_count(address), []
-                ).append(address)
-        if not addresses_by_usage:
+                usage = len(in_use_connections(address, ()))
+                if least_usage is None or usage < least_usage:
+                    least_usage = usage
+                    least_used = [address]
+                elif usage == least_usage:
+                    least_used.append(address)
+        if not least_used:
             if access_mode == READ_ACCESS:
                 raise ReadServiceUnavailable(
                     "No read service currently available"
@@ -716,7 +885,7 @@ class Neo4jPool(IOPool):
                 raise WriteServiceUnavailable(
                     "No write service currently available"
                 )
-        return choice(addresses_by_usage[min(addresses_by_usage)])
+        return choice(least_used)
 
     def acquire(
         self, access_mode, timeout, acquisition_timeout,
@@ -734,9 +903,16 @@ class Neo4jPool(IOPool):
 
         from neo4j.api import check_access_mode
         access_mode = check_access_mode(access_mode)
-        with self._refresh_lock_deadline(deadline):
-            log.debug("[#0000]  C: <ROUTING TABLE ENSURE FRESH> %r",
-                      self.routing_tables)
+        fresh_until = self._fresh_until.get(
+            (database, access_mode == READ_ACCESS), 0.0
+        )
+        if database not in self.routing_tables or perf_counter() >= fresh_until:
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[#0000]  C: <ROUTING TABLE ENSURE FRESH> %r",
+                          self.routing_tables)
+            # ensure_routing_table_is_fresh takes the refresh lock itself;
+            # wrapping it in another acquisition here would only pay the
+            # RLock re-entry cost a second time.
             self.ensure_routing_table_is_fresh(
                 access_mode=access_mode, database=database, imp_user=None,
                 bookmarks=bookmarks, deadline=deadline
@@ -757,7 +933,11 @@ class Neo4jPool(IOPool):
             except (ReadServiceUnavailable, WriteServiceUnavailable) as err:
                 raise SessionExpired("Failed to obtain connection towards '%s' server." % access_mode) from err
             try:
-                log.debug("[#0000]  C: <ACQUIRE ADDRESS> database=%r address=%r", database, address)
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(
+                        "[#0000]  C: <ACQUIRE ADDRESS> database=%r address=%r",
+                        database, address
+                    )
                 # should always be a resolved address
                 connection = self._acquire(
                     address, deadline, liveness_check_timeout
@@ -772,20 +952,57 @@ class Neo4jPool(IOPool):
         if present, remove from the routing table and also closing
         all idle connections to that address.
         """
-        log.debug("[#0000]  C: <ROUTING> Deactivating address %r", address)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[#0000]  C: <ROUTING> Deactivating address %r", address)
+        self._fresh_until.clear()
+        self._resolve_cache.pop(getattr(address, "unresolved", address), None)
         # We use `discard` instead of `remove` here since the former
         # will not fail if the address has already been removed.
-        for database in self.routing_tables.keys():
-            self.routing_tables[database].routers.discard(address)
-            self.routing_tables[database].readers.discard(address)
-            self.routing_tables[database].writers.discard(address)
-        log.debug("[#0000]  C: <ROUTING> table=%r", self.routing_tables)
+        for routing_table in self.routing_tables.values():
+            routing_table.routers.discard(address)
+            routing_table.readers.discard(address)
+            routing_table.writers.discard(address)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[#0000]  C: <ROUTING> table=%r", self.routing_tables)
         super(Neo4jPool, self).deactivate(address)
 
+    def deactivate_many(self, addresses):
+        """ Deactivate multiple addresses at once.
+
+        Does the same as calling :meth:`deactivate` for each address, but
+        prunes all routing tables in a single pass.
+        """
+        addresses = set(addresses)
+        if not addresses:
+            return
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[#0000]  C: <ROUTING> Deactivating addresses %r",
+                      addresses)
+        self._fresh_until.clear()
+        for address in addresses:
+            self._resolve_cache.pop(
+                getattr(address, "unresolved", address), None
+            )
+        for routing_table in self.routing_tables.values():
+            routing_table.routers.difference_update(addresses)
+            routing_table.readers.difference_update(addresses)
+            routing_table.writers.difference_update(addresses)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[#0000]  C: <ROUTING> table=%r", self.routing_tables)
+        deactivate = super(Neo4jPool, self).deactivate
+        for address in addresses:
+            deactivate(address)
+
     def on_write_failure(self, address):
         """ Remove a writer address from the routing table, if present.
         """
-        log.debug("[#0000]  C: <ROUTING> Removing writer %r", address)
-        for database in self.routing_tables.keys():
-            self.routing_tables[database].writers.discard(address)
-        log.debug("[#0000]  C: <ROUTING> table=%r", self.routing_tables)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[#0000]  C: <ROUTING> Removing writer %r", address)
+        # the cached writer freshness is no longer trustworthy; the next
+        # write acquire must re-check the routing table
+        for key in [key for key in self._fresh_until if not key[1]]:
+            del self._fresh_until[key]
+        for routing_table in self.routing_tables.values():
+            routing_table.writers.discard(address)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[#0000]  C: <ROUTING> table=%r", self.routing_tables)
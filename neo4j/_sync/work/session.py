@@ -16,6 +16,8 @@
 # limitations under the License.
 
 
+import logging
+from collections.abc import Iterable
 from logging import getLogger
 from random import random
 from time import perf_counter
@@ -51,6 +53,15 @@ from .workspace import Workspace
 log = getLogger("neo4j")
 
 
+# Errors that mark an attempt of a managed transaction as failed
+# (and potentially retryable).
+_RETRY_EXCEPTIONS = (DriverError, Neo4jError)
+# Errors swallowed while winding down the connection on session close.
+_CLOSE_SWALLOWED_EXCEPTIONS = (
+    Neo4jError, TransactionError, ServiceUnavailable, SessionExpired
+)
+
+
 class Session(Workspace):
     """A :class:`.Session` is a logical context for transactional units
     of work. Connections are drawn from the :class:`.Driver` connection
@@ -72,22 +83,25 @@ class Session(Workspace):
     :param config: session config instance
     """
 
-    # The current connection.
-    _connection = None
-
-    # The current :class:`.Transaction` instance, if any.
-    _transaction = None
-
-    # The current auto-transaction result, if any.
-    _auto_result = None
-
-    # The state this session is in.
-    _state_failed = False
+    __slots__ = (
+        "_transaction",
+        "_auto_result",
+        "_state_failed",
+        "_bookmarks_obj",
+    )
 
     def __init__(self, pool, session_config):
         super().__init__(pool, session_config)
         assert isinstance(session_config, SessionConfig)
         self._bookmarks = self._prepare_bookmarks(session_config.bookmarks)
+        # Memoized Bookmarks view of _bookmarks for last_bookmarks().
+        self._bookmarks_obj = None
+        # The current :class:`.Transaction` instance, if any.
+        self._transaction = None
+        # The current auto-transaction result, if any.
+        self._auto_result = None
+        # The state this session is in.
+        self._state_failed = False
 
     def __enter__(self):
         return self
@@ -98,9 +112,13 @@ class Session(Workspace):
         self.close()
 
     def _prepare_bookmarks(self, bookmarks):
+        if bookmarks is None:
+            # far and away the most common case; don't make it pay for
+            # the isinstance/hasattr checks below
+            return ()
         if isinstance(bookmarks, Bookmarks):
             return tuple(bookmarks.raw_values)
-        if hasattr(bookmarks, "__iter__"):
+        if isinstance(bookmarks, Iterable):
             deprecation_warn(
                 "Passing an iterable as `bookmarks` to `Session` is "
                 "deprecated. Please use a `Bookmarks` instance.",
@@ -118,8 +136,10 @@ class Session(Workspace):
         super()._connect(access_mode, **access_kwargs)
 
     def _collect_bookmark(self, bookmark):
-        if bookmark:
+        if bookmark and (not self._bookmarks
+                         or self._bookmarks[-1] != bookmark):
             self._bookmarks = bookmark,
+            self._bookmarks_obj = None
 
     def _result_closed(self):
         if self._auto_result:
@@ -159,7 +179,7 @@ class Session(Workspace):
                         self._state_failed = True
 
             if self._transaction:
-                if self._transaction._closed() is False:
+                if self._transaction._closed_flag is False:
                     # roll back the transaction if it is not closed
                     self._transaction._rollback()
                 self._transaction = None
@@ -169,13 +189,7 @@ class Session(Workspace):
                     self._connection.send_all()
                     self._connection.fetch_all()
                     # TODO: Investigate potential non graceful close states
-            except Neo4jError:
-                pass
-            except TransactionError:
-                pass
-            except ServiceUnavailable:
-                pass
-            except SessionExpired:
+            except _CLOSE_SWALLOWED_EXCEPTIONS:
                 pass
             finally:
                 self._disconnect()
@@ -217,23 +231,24 @@ class Session(Workspace):
         if self._transaction:
             raise ClientError("Explicit Transaction must be handled explicitly")
 
-        if self._auto_result:
+        if self._auto_result and not self._auto_result._exhausted:
             # This will buffer upp all records for the previous auto-transaction
             self._auto_result._buffer_all()
 
+        config = self._config
         if not self._connection:
-            self._connect(self._config.default_access_mode)
+            self._connect(config.default_access_mode)
         cx = self._connection
         protocol_version = cx.PROTOCOL_VERSION
         server_info = cx.server_info
 
         self._auto_result = Result(
-            cx, self._config.fetch_size, self._result_closed,
+            cx, config.fetch_size, self._result_closed,
             self._result_error
         )
         self._auto_result._run(
-            query, parameters, self._config.database,
-            self._config.impersonated_user, self._config.default_access_mode,
+            query, parameters, config.database,
+            config.impersonated_user, config.default_access_mode,
             self._bookmarks, **kwargs
         )
 
@@ -265,7 +280,7 @@ class Session(Workspace):
         if self._auto_result:
             self._auto_result.consume()
 
-        if self._transaction and self._transaction._closed:
+        if self._transaction and self._transaction._closed_flag:
             self._collect_bookmark(self._transaction._bookmark)
             self._transaction = None
 
@@ -307,11 +322,13 @@ class Session(Workspace):
         if self._auto_result:
             self._auto_result.consume()
 
-        if self._transaction and self._transaction._closed():
+        if self._transaction and self._transaction._closed_flag:
             self._collect_bookmark(self._transaction._bookmark)
             self._transaction = None
 
-        return Bookmarks.from_raw_values(self._bookmarks)
+        if self._bookmarks_obj is None:
+            self._bookmarks_obj = Bookmarks.from_raw_values(self._bookmarks)
+        return self._bookmarks_obj
 
     def _transaction_closed_handler(self):
         if self._transaction:
@@ -390,15 +407,18 @@ class Session(Workspace):
         metadata = getattr(transaction_function, "metadata", None)
         timeout = getattr(transaction_function, "timeout", None)
 
-        retry_delay = retry_delay_generator(
-            self._config.initial_retry_delay,
-            self._config.retry_delay_multiplier,
-            self._config.retry_delay_jitter_factor
-        )
+        # Backoff state, initialized when the first attempt actually
+        # fails; in the common case the transaction succeeds right away
+        # and neither it (nor the config reads feeding it) is ever needed.
+        next_delay = None
 
-        errors = []
+        # Collected retryable errors; allocated on first failure only.
+        errors = None
 
-        t0 = -1  # Timer
+        # Absolute point in time after which no more retries are attempted;
+        # started after the first attempt.
+        retry_deadline = None
+        max_retry_time = self._config.max_transaction_retry_time
 
         while True:
             try:
@@ -415,22 +435,37 @@ class Session(Workspace):
                     raise
                 else:
                     tx._commit()
-            except (DriverError, Neo4jError) as error:
-                self._disconnect()
+            except _RETRY_EXCEPTIONS as error:
+                # The transaction's closed/error callbacks usually have
+                # released the connection back to the pool already; only
+                # disconnect if that didn't happen (e.g., the failure
+                # struck while opening the transaction).
+                if self._connection:
+                    self._disconnect()
                 if not error.is_retryable():
                     raise
-                errors.append(error)
+                if errors is None:
+                    errors = [error]
+                else:
+                    errors.append(error)
             else:
                 return result
-            if t0 == -1:
-                # The timer should be started after the first attempt
-                t0 = perf_counter()
-            t1 = perf_counter()
-            if t1 - t0 > self._config.max_transaction_retry_time:
+            if retry_deadline is None:
+                retry_deadline = perf_counter() + max_retry_time
+            elif perf_counter() > retry_deadline:
                 break
-            delay = next(retry_delay)
-            log.warning("Transaction failed and will be retried in {}s ({})"
-                        "".format(delay, "; ".join(errors[-1].args)))
+            if next_delay is None:
+                next_delay = self._config.initial_retry_delay
+                multiplier = self._config.retry_delay_multiplier
+                jitter_factor = self._config.retry_delay_jitter_factor
+            jitter = jitter_factor * next_delay
+            delay = next_delay - jitter + 2 * jitter * random()
+            next_delay *= multiplier
+            if log.isEnabledFor(logging.WARNING):
+                log.warning(
+                    "Transaction failed and will be retried in %ss (%s)",
+                    delay, "; ".join(map(str, errors[-1].args))
+                )
             sleep(delay)
 
         if errors:
@@ -527,11 +562,3 @@ class Session(Workspace):
         return self._run_transaction(
             WRITE_ACCESS, transaction_function, *args, **kwargs
         )
-
-
-def retry_delay_generator(initial_delay, multiplier, jitter_factor):
-    delay = initial_delay
-    while True:
-        jitter = jitter_factor * delay
-        yield delay - jitter + (2 * jitter * random())
-        delay *= multiplier
@@ -33,6 +33,17 @@ from ..io import Neo4jPool
 
 class Workspace:
 
+    __slots__ = (
+        "_pool",
+        "_config",
+        "_connection",
+        "_connection_access_mode",
+        "_cached_database",
+        "_bookmarks",
+        "_closed",
+        "__weakref__",
+    )
+
     def __init__(self, pool, config):
         assert isinstance(config, WorkspaceConfig)
         self._pool = pool
@@ -75,17 +86,16 @@ class Workspace:
         self._config.database = database
 
     def _connect(self, access_mode, **acquire_kwargs):
-        timeout = Deadline(self._config.session_connection_timeout)
+        config = self._config
+        timeout = Deadline(config.session_connection_timeout)
         if self._connection:
             # TODO: Investigate this
             # log.warning("FIXME: should always disconnect before connect")
-            self._connection.send_all()
-            self._connection.fetch_all()
-            self._disconnect()
+            self._disconnect(sync=True)
         if not self._cached_database:
-            if (self._config.database is not None
+            if (config.database is not None
                     or not isinstance(self._pool, Neo4jPool)):
-                self._set_cached_database(self._config.database)
+                self._set_cached_database(config.database)
             else:
                 # This is the first time we open a connection to a server in a
                 # cluster environment for this session without explicitly
@@ -94,8 +104,8 @@ class Workspace:
                 # we shall use this database explicitly for all subsequent
                 # actions within this session.
                 self._pool.update_routing_table(
-                    database=self._config.database,
-                    imp_user=self._config.impersonated_user,
+                    database=config.database,
+                    imp_user=config.impersonated_user,
                     bookmarks=self._bookmarks,
                     timeout=timeout,
                     database_callback=self._set_cached_database
@@ -103,12 +113,12 @@ class Workspace:
         acquire_kwargs_ = {
             "access_mode": access_mode,
             "timeout": timeout,
-            "acquisition_timeout": self._config.connection_acquisition_timeout,
-            "database": self._config.database,
+            "acquisition_timeout": config.connection_acquisition_timeout,
+            "database": config.database,
             "bookmarks": self._bookmarks,
             "liveness_check_timeout": None,
+            **acquire_kwargs,
         }
-        acquire_kwargs_.update(acquire_kwargs)
         self._connection = self._pool.acquire(**acquire_kwargs_)
         self._connection_access_mode = access_mode
 
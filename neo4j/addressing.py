@@ -17,6 +17,7 @@
 
 
 import logging
+from functools import lru_cache
 from socket import (
     AF_INET,
     AF_INET6,
@@ -27,6 +28,31 @@ from socket import (
 log = logging.getLogger("neo4j")
 
 
+@lru_cache(maxsize=128)
+def _str_ipv4(host, port):
+    return "{}:{}".format(host, port)
+
+
+@lru_cache(maxsize=128)
+def _str_ipv6(host, port):
+    return "[{}]:{}".format(host, port)
+
+
+@lru_cache(maxsize=256)
+def _resolve_port_number(port):
+    # getservbyname can hit the OS services database; the mapping is
+    # static per process, so cache it per port value
+    try:
+        return getservbyname(port)
+    except (OSError, TypeError):
+        # OSError: service/proto not found
+        # TypeError: getservbyname() argument 1 must be str, not X
+        try:
+            return int(port)
+        except (TypeError, ValueError) as e:
+            raise type(e)("Unknown port value %r" % port)
+
+
 class _AddressMeta(type(tuple)):
 
     def __init__(self, *args, **kwargs):
@@ -62,6 +88,8 @@ class _AddressMeta(type(tuple)):
 
 class Address(tuple, metaclass=_AddressMeta):
 
+    __slots__ = ()
+
     @classmethod
     def from_socket(cls, socket):
         address = socket.getpeername()
@@ -75,19 +103,17 @@ class Address(tuple, metaclass=_AddressMeta):
             # IPv6
             host, _, port = s[1:].rpartition("]")
             port = port.lstrip(":")
-            try:
+            if port.isdigit():
                 port = int(port)
-            except (TypeError, ValueError):
-                pass
+            # else: named service; leave as-is
             return cls((host or default_host or "localhost",
                         port or default_port or 0, 0, 0))
         else:
             # IPv4
             host, _, port = s.partition(":")
-            try:
+            if port.isdigit():
                 port = int(port)
-            except (TypeError, ValueError):
-                pass
+            # else: named service; leave as-is
             return cls((host or default_host or "localhost",
                         port or default_port or 0))
 
@@ -99,21 +125,21 @@ class Address(tuple, metaclass=_AddressMeta):
         if not all(isinstance(s0, str) for s0 in s):
             raise TypeError("Address.parse_list requires a string argument")
         return [Address.parse(a, default_host, default_port)
-                for a in " ".join(s).split()]
+                for s0 in s for a in s0.split()]
 
     def __new__(cls, iterable):
         if isinstance(iterable, cls):
             return iterable
         n_parts = len(iterable)
-        inst = tuple.__new__(cls, iterable)
+        # build the right subclass straight away; reassigning __class__
+        # after the fact costs a type-layout check per construction
+        # (the property is only consulted for un-seeded subclasses)
         if n_parts == 2:
-            inst.__class__ = cls.ipv4_cls
-        elif n_parts == 4:
-            inst.__class__ = cls.ipv6_cls
-        else:
-            raise ValueError("Addresses must consist of either "
-                             "two parts (IPv4) or four parts (IPv6)")
-        return inst
+            return tuple.__new__(cls._ipv4_cls or cls.ipv4_cls, iterable)
+        if n_parts == 4:
+            return tuple.__new__(cls._ipv6_cls or cls.ipv6_cls, iterable)
+        raise ValueError("Addresses must consist of either "
+                         "two parts (IPv4) or four parts (IPv6)")
 
     #: Address family (AF_INET or AF_INET6)
     family = None
@@ -139,34 +165,35 @@ class Address(tuple, metaclass=_AddressMeta):
 
     @property
     def port_number(self):
-        try:
-            return getservbyname(self[1])
-        except (OSError, TypeError):
-            # OSError: service/proto not found
-            # TypeError: getservbyname() argument 1 must be str, not X
-            try:
-                return int(self[1])
-            except (TypeError, ValueError) as e:
-                raise type(e)("Unknown port value %r" % self[1])
+        return _resolve_port_number(self[1])
 
 
 class IPv4Address(Address):
 
+    __slots__ = ()
+
     family = AF_INET
 
     def __str__(self):
-        return "{}:{}".format(*self)
+        # tuple subtypes can't carry an extra slot for a per-instance
+        # cache, so memoize the formatted form by value instead; pool
+        # logging stringifies the same few addresses over and over
+        return _str_ipv4(self[0], self[1])
 
 
 class IPv6Address(Address):
 
+    __slots__ = ()
+
     family = AF_INET6
 
     def __str__(self):
-        return "[{}]:{}".format(*self)
+        return _str_ipv6(self[0], self[1])
 
 
 class ResolvedAddress(Address):
+    # no __slots__ here: tuple subtypes can't carry nonempty slots, and
+    # this class needs the instance __dict__ for _host_name
 
     @property
     def host_name(self):
@@ -174,11 +201,18 @@ class ResolvedAddress(Address):
 
     @property
     def unresolved(self):
-        return super().__new__(Address, (self._host_name, *self[1:]))
+        # immutable, so the first computed form can be kept around;
+        # routing-table bookkeeping reads this per address and pass
+        if self._unresolved is None:
+            self._unresolved = super().__new__(
+                Address, (self._host_name, *self[1:])
+            )
+        return self._unresolved
 
     def __new__(cls, iterable, host_name=None):
         new = super().__new__(cls, iterable)
         new._host_name = host_name
+        new._unresolved = None
         return new
 
 
@@ -188,3 +222,11 @@ class ResolvedIPv4Address(IPv4Address, ResolvedAddress):
 
 class ResolvedIPv6Address(IPv6Address, ResolvedAddress):
     pass
+
+
+# Pre-seed the metaclass caches; the subclasses are statically known, so
+# the first Address() call needn't walk __subclasses__() to find them.
+Address._ipv4_cls = IPv4Address
+Address._ipv6_cls = IPv6Address
+ResolvedAddress._ipv4_cls = ResolvedIPv4Address
+ResolvedAddress._ipv6_cls = ResolvedIPv6Address
@@ -19,10 +19,11 @@
 """
 
 
-from urllib.parse import (
-    parse_qs,
-    urlparse,
-)
+import struct
+import types
+from collections import namedtuple
+from functools import lru_cache
+from urllib.parse import unquote_plus
 
 from ._meta import deprecated
 from .exceptions import ConfigurationError
@@ -31,6 +32,8 @@ from .exceptions import ConfigurationError
 READ_ACCESS = "READ"
 WRITE_ACCESS = "WRITE"
 
+_VALID_ACCESS_MODES = frozenset((READ_ACCESS, WRITE_ACCESS))
+
 DRIVER_BOLT = "DRIVER_BOLT"
 DRIVER_NEO4j = "DRIVER_NEO4J"
 
@@ -55,6 +58,27 @@ TRUST_ALL_CERTIFICATES = "TRUST_ALL_CERTIFICATES"
 SYSTEM_DATABASE = "system"
 DEFAULT_DATABASE = None  # Must be a non string hashable value
 
+_SCHEME_TABLE = types.MappingProxyType({
+    URI_SCHEME_BOLT:
+        (DRIVER_BOLT, SECURITY_TYPE_NOT_SECURE),
+    URI_SCHEME_BOLT_SELF_SIGNED_CERTIFICATE:
+        (DRIVER_BOLT, SECURITY_TYPE_SELF_SIGNED_CERTIFICATE),
+    URI_SCHEME_BOLT_SECURE:
+        (DRIVER_BOLT, SECURITY_TYPE_SECURE),
+    URI_SCHEME_NEO4J:
+        (DRIVER_NEO4j, SECURITY_TYPE_NOT_SECURE),
+    URI_SCHEME_NEO4J_SELF_SIGNED_CERTIFICATE:
+        (DRIVER_NEO4j, SECURITY_TYPE_SELF_SIGNED_CERTIFICATE),
+    URI_SCHEME_NEO4J_SECURE:
+        (DRIVER_NEO4j, SECURITY_TYPE_SECURE),
+})
+
+_UNSUPPORTED_SCHEME_MSG = (
+    "URI scheme {{!r}} is not supported. Supported URI schemes are {}. "
+    "Examples: bolt://host[:port] or neo4j://host[:port][?routing_context]"
+    .format(list(_SCHEME_TABLE))
+)
+
 
 # TODO: This class is not tested
 class Auth:
@@ -75,17 +99,28 @@ class Auth:
     """
 
     def __init__(self, scheme, principal, credentials, realm=None, **parameters):
+        # Every instance carries the same attributes (None meaning
+        # "unset"); a fixed shape keeps CPython's attribute caches warm
+        # and the wire serialization filters the None entries out.
         self.scheme = scheme
         # Neo4j servers pre 4.4 require the principal field to always be
         # present. Therefore, we transmit it even if it's an empty sting.
-        if principal is not None:
-            self.principal = principal
-        if credentials:
-            self.credentials = credentials
-        if realm:
-            self.realm = realm
-        if parameters:
-            self.parameters = parameters
+        self.principal = principal
+        self.credentials = credentials or None
+        self.realm = realm or None
+        self.parameters = parameters or None
+
+    @classmethod
+    def _make(cls, scheme, principal, credentials, realm=None):
+        # construction path for the fixed-scheme helpers below, which
+        # never carry extra parameters; skips the **kwargs machinery
+        obj = object.__new__(cls)
+        obj.scheme = scheme
+        obj.principal = principal
+        obj.credentials = credentials or None
+        obj.realm = realm or None
+        obj.parameters = None
+        return obj
 
 
 # For backwards compatibility
@@ -108,7 +143,7 @@ def basic_auth(user, password, realm=None):
         :meth:`AsyncGraphDatabase.driver`
     :rtype: :class:`neo4j.Auth`
     """
-    return Auth("basic", user, password, realm)
+    return Auth._make("basic", user, password, realm)
 
 
 def kerberos_auth(base64_encoded_ticket):
@@ -124,7 +159,7 @@ def kerberos_auth(base64_encoded_ticket):
         :meth:`AsyncGraphDatabase.driver`
     :rtype: :class:`neo4j.Auth`
     """
-    return Auth("kerberos", "", base64_encoded_ticket)
+    return Auth._make("kerberos", "", base64_encoded_ticket)
 
 
 def bearer_auth(base64_encoded_token):
@@ -140,7 +175,7 @@ def bearer_auth(base64_encoded_token):
         :meth:`AsyncGraphDatabase.driver`
     :rtype: :class:`neo4j.Auth`
     """
-    return Auth("bearer", None, base64_encoded_token)
+    return Auth._make("bearer", None, base64_encoded_token)
 
 
 def custom_auth(principal, credentials, realm, scheme, **parameters):
@@ -165,6 +200,9 @@ def custom_auth(principal, credentials, realm, scheme, **parameters):
     return Auth(scheme, principal, credentials, realm, **parameters)
 
 
+_BOOKMARK_NOT_STR_MSG = "Raw bookmark values must be str. Found {}"
+
+
 # TODO 6.0 - remove this class
 class Bookmark:
     """A Bookmark object contains an immutable list of bookmark string values.
@@ -176,26 +214,30 @@ class Bookmark:
     :param values: ASCII string values
     """
 
+    __slots__ = ("_values", "_repr")
+
     @deprecated("Use the `Bookmarks`` class instead.")
     def __init__(self, *values):
         if values:
             bookmarks = []
             for ix in values:
-                try:
-                    if ix:
-                        ix.encode("ascii")
-                        bookmarks.append(ix)
-                except UnicodeEncodeError as e:
+                if not ix:
+                    continue
+                if not ix.isascii():
                     raise ValueError("The value {} is not ASCII".format(ix))
+                bookmarks.append(ix)
             self._values = frozenset(bookmarks)
         else:
             self._values = frozenset()
+        self._repr = None
 
     def __repr__(self):
         """
         :return: repr string with sorted values
         """
-        return "<Bookmark values={{{}}}>".format(", ".join(["'{}'".format(ix) for ix in sorted(self._values)]))
+        if self._repr is None:
+            self._repr = "<Bookmark values={{{}}}>".format(", ".join(["'{}'".format(ix) for ix in sorted(self._values)]))
+        return self._repr
 
     def __bool__(self):
         return bool(self._values)
@@ -221,29 +263,54 @@ class Bookmarks:
         bookmarks3 = bookmarks1 + bookmarks2
     """
 
+    __slots__ = ("_raw_values", "_repr")
+
     def __init__(self):
         self._raw_values = frozenset()
+        self._repr = None
 
     def __repr__(self):
         """
         :return: repr string with sorted values
         """
-        return "<Bookmarks values={{{}}}>".format(
-            ", ".join(map(repr, sorted(self._raw_values)))
-        )
+        # instances are immutable, so the sorted form is computed once
+        if self._repr is None:
+            self._repr = "<Bookmarks values={{{}}}>".format(
+                ", ".join(map(repr, sorted(self._raw_values)))
+            )
+        return self._repr
 
     def __bool__(self):
         return bool(self._raw_values)
 
     def __add__(self, other):
         if isinstance(other, Bookmarks):
-            if not other:
+            # Bookmarks are immutable, so when one side already covers
+            # the other it can be returned as-is instead of allocating
+            # a new union (typical when chaining within one session).
+            if other._raw_values <= self._raw_values:
                 return self
+            if self._raw_values <= other._raw_values:
+                return other
             ret = self.__class__()
             ret._raw_values = self._raw_values | other._raw_values
             return ret
         return NotImplemented
 
+    # instances stay immutable; this only routes += through the
+    # subset fast paths of __add__
+    __iadd__ = __add__
+
+    @classmethod
+    def _merge_all(cls, bookmarks_iter):
+        # bulk union in one C call instead of N pairwise unions when
+        # combining bookmarks accumulated over many transactions
+        obj = cls()
+        obj._raw_values = frozenset().union(
+            *(b._raw_values for b in bookmarks_iter)
+        )
+        return obj
+
     @property
     def raw_values(self):
         """The raw bookmark values.
@@ -266,18 +333,20 @@ class Bookmarks:
         :param values: ASCII string values (raw bookmarks)
         :type values: Iterable[str]
         """
+        def checked_values():
+            for value in values:
+                if not isinstance(value, str):
+                    raise TypeError(_BOOKMARK_NOT_STR_MSG.format(type(value)))
+                if not value.isascii():
+                    # truncate: arbitrary garbage input shouldn't be
+                    # copied wholesale into the exception message
+                    raise ValueError(f"The value {value!r:.128} is not ASCII")
+                yield value
+
         obj = cls()
-        bookmarks = []
-        for value in values:
-            if not isinstance(value, str):
-                raise TypeError("Raw bookmark values must be str. "
-                                "Found {}".format(type(value)))
-            try:
-                value.encode("ascii")
-            except UnicodeEncodeError as e:
-                raise ValueError(f"The value {value} is not ASCII") from e
-            bookmarks.append(value)
-        obj._raw_values = frozenset(bookmarks)
+        # str.isascii is a C-level check; no throwaway bytes object per
+        # value like the previous encode("ascii") probe
+        obj._raw_values = frozenset(checked_values())
         return obj
 
 
@@ -285,6 +354,8 @@ class ServerInfo:
     """ Represents a package of information relating to a Neo4j server.
     """
 
+    __slots__ = ("_address", "_protocol_version", "_metadata")
+
     def __init__(self, address, protocol_version):
         self._address = address
         self._protocol_version = protocol_version
@@ -330,6 +401,8 @@ class ServerInfo:
 
 class Version(tuple):
 
+    __slots__ = ()
+
     def __new__(cls, *v):
         return super().__new__(cls, v)
 
@@ -340,29 +413,74 @@ class Version(tuple):
         return ".".join(map(str, self))
 
     def to_bytes(self):
-        b = bytearray(4)
-        for i, v in enumerate(self):
-            if not 0 <= i < 2:
-                raise ValueError("Too many version components")
-            if isinstance(v, list):
-                b[-i - 1] = int(v[0] % 0x100)
-                b[-i - 2] = int((v[0] - v[-1]) % 0x100)
-            else:
-                b[-i - 1] = int(v % 0x100)
-        return bytes(b)
+        if len(self) > 2:
+            raise ValueError("Too many version components")
+        if any(isinstance(v, list) for v in self):
+            # version range form, e.g. Version(4, [3, 0]); rare enough
+            # to keep on the loop-based encoding
+            b = bytearray(4)
+            for i, v in enumerate(self):
+                if isinstance(v, list):
+                    b[-i - 1] = int(v[0] % 0x100)
+                    b[-i - 2] = int((v[0] - v[-1]) % 0x100)
+                else:
+                    b[-i - 1] = int(v % 0x100)
+            return bytes(b)
+        major = self[0] % 0x100 if len(self) >= 1 else 0
+        minor = self[1] % 0x100 if len(self) >= 2 else 0
+        return struct.pack(">HBB", 0, minor, major)
 
     @classmethod
     def from_bytes(cls, b):
-        b = bytearray(b)
         if len(b) != 4:
             raise ValueError("Byte representation must be exactly four bytes")
         if b[0] != 0 or b[1] != 0:
             raise ValueError("First two bytes must contain zero")
-        return Version(b[-1], b[-2])
+        return Version(b[3], b[2])
 
 
+_ParsedUri = namedtuple(
+    "_ParsedUri", ("scheme", "netloc", "query", "username", "password")
+)
+
+
+def _parse_uri(uri):
+    # Targeted replacement for urllib.parse.urlparse: bolt/neo4j URIs
+    # only ever carry scheme, netloc, and query, so a couple of splits
+    # beat the general-purpose parser on the driver construction path.
+    scheme, sep, rest = uri.partition("://")
+    if not sep:
+        scheme, rest = "", uri
+    rest, _, _ = rest.partition("#")
+    rest, _, query = rest.partition("?")
+    netloc, _, _ = rest.partition("/")
+    username = password = None
+    userinfo, sep, _ = netloc.rpartition("@")
+    if sep:
+        username, sep, password = userinfo.partition(":")
+        if not sep:
+            password = None
+    return _ParsedUri(scheme.lower(), netloc, query, username, password)
+
+
+def parse_scheme(scheme):
+    """ Resolve a URI scheme to a (driver_type, security_type) pair.
+    """
+    if scheme == URI_SCHEME_BOLT_ROUTING:
+        raise ConfigurationError("Uri scheme {!r} have been renamed. Use {!r}".format(scheme, URI_SCHEME_NEO4J))
+    try:
+        return _SCHEME_TABLE[scheme]
+    except KeyError:
+        raise ConfigurationError(
+            _UNSUPPORTED_SCHEME_MSG.format(scheme)
+        ) from None
+
+
+@lru_cache(maxsize=128)
 def parse_neo4j_uri(uri):
-    parsed = urlparse(uri)
+    # pure function of the URI, so repeated driver constructions with
+    # the same URI (request handlers, test suites) hit the cache
+    parsed = _parse_uri(uri)
 
     if parsed.username:
         raise ConfigurationError("Username is not supported in the URI")
@@ -370,38 +488,7 @@ def parse_neo4j_uri(uri):
     if parsed.password:
         raise ConfigurationError("Password is not supported in the URI")
 
-    if parsed.scheme == URI_SCHEME_BOLT_ROUTING:
-        raise ConfigurationError("Uri scheme {!r} have been renamed. Use {!r}".format(parsed.scheme, URI_SCHEME_NEO4J))
-    elif parsed.scheme == URI_SCHEME_BOLT:
-        driver_type = DRIVER_BOLT
-        security_type = SECURITY_TYPE_NOT_SECURE
-    elif parsed.scheme == URI_SCHEME_BOLT_SELF_SIGNED_CERTIFICATE:
-        driver_type = DRIVER_BOLT
-        security_type = SECURITY_TYPE_SELF_SIGNED_CERTIFICATE
-    elif parsed.scheme == URI_SCHEME_BOLT_SECURE:
-        driver_type = DRIVER_BOLT
-        security_type = SECURITY_TYPE_SECURE
-    elif parsed.scheme == URI_SCHEME_NEO4J:
-        driver_type = DRIVER_NEO4j
-        security_type = SECURITY_TYPE_NOT_SECURE
-    elif parsed.scheme == URI_SCHEME_NEO4J_SELF_SIGNED_CERTIFICATE:
-        driver_type = DRIVER_NEO4j
-        security_type = SECURITY_TYPE_SELF_SIGNED_CERTIFICATE
-    elif parsed.scheme == URI_SCHEME_NEO4J_SECURE:
-        driver_type = DRIVER_NEO4j
-        security_type = SECURITY_TYPE_SECURE
-    else:
-        raise ConfigurationError("URI scheme {!r} is not supported. Supported URI schemes are {}. Examples: bolt://host[:port] or neo4j://host[:port][?routing_context]".format(
-            parsed.scheme,
-            [
-                URI_SCHEME_BOLT,
-                URI_SCHEME_BOLT_SELF_SIGNED_CERTIFICATE,
-                URI_SCHEME_BOLT_SECURE,
-                URI_SCHEME_NEO4J,
-                URI_SCHEME_NEO4J_SELF_SIGNED_CERTIFICATE,
-                URI_SCHEME_NEO4J_SECURE
-            ]
-        ))
+    driver_type, security_type = parse_scheme(parsed.scheme)
 
     return driver_type, security_type, parsed
 
@@ -409,11 +496,10 @@ def parse_neo4j_uri(uri):
 def check_access_mode(access_mode):
     if access_mode is None:
         return WRITE_ACCESS
-    if access_mode not in (READ_ACCESS, WRITE_ACCESS):
-        msg = "Unsupported access mode {}".format(access_mode)
-        raise ConfigurationError(msg)
-
-    return access_mode
+    if access_mode in _VALID_ACCESS_MODES:
+        return access_mode
+    msg = "Unsupported access mode {}".format(access_mode)
+    raise ConfigurationError(msg)
 
 
 def parse_routing_context(query):
@@ -423,14 +509,16 @@ def parse_routing_context(query):
         return {}
 
     context = {}
-    parameters = parse_qs(query, True)
-    for key in parameters:
-        value_list = parameters[key]
-        if len(value_list) != 1:
-            raise ConfigurationError("Duplicated query parameters with key '%s', value '%s' found in query string '%s'" % (key, value_list, query))
-        value = value_list[0]
+    for pair in query.split("&"):
+        if not pair:
+            continue
+        key, _, value = pair.partition("=")
+        key = unquote_plus(key)
+        value = unquote_plus(value)
         if not value:
             raise ConfigurationError("Invalid parameters:'%s=%s' in query string '%s'." % (key, value, query))
+        if key in context:
+            raise ConfigurationError("Duplicated query parameters with key '%s', value '%s' found in query string '%s'" % (key, [context[key], value], query))
         context[key] = value
 
     return context
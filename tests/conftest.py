@@ -41,6 +41,37 @@ from . import env
 # watch("neo4j")
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--all-combinations", action="store_true", default=False,
+        help="run combinatorially parametrized tests with the full "
+             "Cartesian product instead of the reduced base-choice "
+             "selection",
+    )
+    parser.addoption(
+        "--exhaustive", action="store_true", default=False,
+        help="iterate full value ranges in tests that normally sample "
+             "boundaries plus a few interior points",
+    )
+    parser.addoption(
+        "--loop-debug", action="store_true", default=False,
+        help="run async tests with asyncio debug mode enabled so "
+             "blocking calls that stall the event loop get logged",
+    )
+
+
+@pytest.fixture
+def event_loop(request):
+    loop = asyncio.new_event_loop()
+    if request.config.getoption("--loop-debug"):
+        # surfaces synchronous calls that hog the loop (logged by the
+        # asyncio logger once they exceed slow_callback_duration)
+        loop.set_debug(True)
+        loop.slow_callback_duration = 0.005
+    yield loop
+    loop.close()
+
+
 @pytest.fixture(scope="session")
 def uri():
     return env.NEO4J_SERVER_URI
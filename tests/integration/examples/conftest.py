@@ -0,0 +1,32 @@
+# Copyright (c) "Neo4j"
+# Neo4j Sweden AB [https://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+from neo4j import GraphDatabase
+
+
+@pytest.fixture(scope="session")
+def shared_driver(uri, auth):
+    # Driver construction (pool warmup, routing) is the expensive part
+    # of these example tests; share one driver across the whole example
+    # suite where the example body doesn't itself demonstrate driver
+    # setup.
+    driver = GraphDatabase.driver(uri, auth=auth)
+    yield driver
+    driver.close()
@@ -37,14 +37,17 @@ from neo4j import GraphDatabase
 # tag::hello-world[]
 class HelloWorldExample:
 
-    def __init__(self, uri, user, password):
+    def __init__(self, uri, user, password, database=None):
         self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        # Naming the target database up front saves the driver a
+        # round trip to resolve the home database per session.
+        self._database = database
 
     def close(self):
         self.driver.close()
 
     def print_greeting(self, message):
-        with self.driver.session() as session:
+        with self.driver.session(database=self._database) as session:
             greeting = session.write_transaction(self._create_and_return_greeting, message)
             print(greeting)
 
@@ -57,7 +60,8 @@ class HelloWorldExample:
 
 
 if __name__ == "__main__":
-    greeter = HelloWorldExample("bolt://localhost:7687", "neo4j", "password")
+    greeter = HelloWorldExample("bolt://localhost:7687", "neo4j", "password",
+                                database="neo4j")
     greeter.print_greeting("hello, world")
     greeter.close()
 # end::hello-world[]
@@ -67,11 +71,23 @@ if __name__ == "__main__":
 # end::hello-world-output[]
 
 
-def test_hello_world_example(uri, auth):
+class _SharedDriverHelloWorldExample(HelloWorldExample):
+    # test-only variant reusing the suite-wide driver; the tagged
+    # example above stays as the documented form
+
+    def __init__(self, driver, database=None):
+        self.driver = driver
+        self._database = database
+
+    def close(self):
+        pass  # the shared driver is closed by its fixture
+
+
+def test_hello_world_example(shared_driver):
     try:
         s = StringIO()
         with redirect_stdout(s):
-            example = HelloWorldExample(uri, auth[0], auth[1])
+            example = _SharedDriverHelloWorldExample(shared_driver)
             example.print_greeting("hello, world")
             example.close()
 
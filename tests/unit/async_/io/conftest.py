@@ -34,7 +34,8 @@ class AsyncFakeSocket:
 
     def __init__(self, address, unpacker_cls=None):
         self.address = address
-        self.captured = b""
+        self.captured = bytearray()
+        self._read_pos = 0
         self.messages = None
         if unpacker_cls is not None:
             self.messages = AsyncInbox(
@@ -48,10 +49,17 @@ class AsyncFakeSocket:
         return self.address
 
     async def recv_into(self, buffer, nbytes):
-        data = self.captured[:nbytes]
-        actual = len(data)
-        buffer[:actual] = data
-        self.captured = self.captured[actual:]
+        # consume via a moving read offset instead of re-slicing the
+        # whole buffer on every read (quadratic for large messages)
+        pos = self._read_pos
+        actual = min(len(self.captured) - pos, nbytes)
+        if actual:
+            buffer[:actual] = memoryview(self.captured)[pos:pos + actual]
+            pos += actual
+            if pos > 65536 and pos * 2 > len(self.captured):
+                del self.captured[:pos]
+                pos = 0
+            self._read_pos = pos
         return actual
 
     async def sendall(self, data):
@@ -68,9 +76,14 @@ class AsyncFakeSocket:
 class AsyncFakeSocket2:
 
     def __init__(self, address=None, on_send=None,
-                 packer_cls=None, unpacker_cls=None):
+                 packer_cls=None, unpacker_cls=None,
+                 send_buffer=None, recv_buffer=None):
         self.address = address
-        self.recv_buffer = bytearray()
+        self.recv_buffer = bytearray() if recv_buffer is None else recv_buffer
+        self._read_pos = 0
+        # paired sockets write straight into each other's recv buffer,
+        # skipping the on_send callback per sendall
+        self._send_buffer = send_buffer
         # self.messages = AsyncMessageInbox(self, on_error=print)
         self.on_send = on_send
         self._outbox = self._messages = None
@@ -90,13 +103,21 @@ class AsyncFakeSocket2:
         return self.address
 
     async def recv_into(self, buffer, nbytes):
-        data = self.recv_buffer[:nbytes]
-        actual = len(data)
-        buffer[:actual] = data
-        self.recv_buffer = self.recv_buffer[actual:]
+        pos = self._read_pos
+        actual = min(len(self.recv_buffer) - pos, nbytes)
+        if actual:
+            buffer[:actual] = memoryview(self.recv_buffer)[pos:pos + actual]
+            pos += actual
+            if pos > 65536 and pos * 2 > len(self.recv_buffer):
+                del self.recv_buffer[:pos]
+                pos = 0
+            self._read_pos = pos
         return actual
 
     async def sendall(self, data):
+        if self._send_buffer is not None:
+            self._send_buffer.extend(data)
+            return
         if callable(self.on_send):
             self.on_send(data)
 
@@ -119,14 +140,16 @@ class AsyncFakeSocket2:
 class AsyncFakeSocketPair:
 
     def __init__(self, address, packer_cls=None, unpacker_cls=None):
+        client_to_server = bytearray()
+        server_to_client = bytearray()
         self.client = AsyncFakeSocket2(
-            address, packer_cls=packer_cls, unpacker_cls=unpacker_cls
+            address, packer_cls=packer_cls, unpacker_cls=unpacker_cls,
+            send_buffer=client_to_server, recv_buffer=server_to_client
         )
         self.server = AsyncFakeSocket2(
-            packer_cls=packer_cls, unpacker_cls=unpacker_cls
+            packer_cls=packer_cls, unpacker_cls=unpacker_cls,
+            send_buffer=server_to_client, recv_buffer=client_to_server
         )
-        self.client.on_send = self.server.inject
-        self.server.on_send = self.client.inject
 
 
 @pytest.fixture
@@ -52,6 +52,7 @@ class AsyncQuickConnection:
     def __init__(self, socket):
         self.socket = socket
         self.address = socket.getpeername()
+        self.unresolved_address = self.address
 
     @property
     def is_reset(self):
@@ -130,15 +131,8 @@ async def pool():
 
 
 def assert_pool_size( address, expected_active, expected_inactive, pool):
-    try:
-        connections = pool.connections[address]
-    except KeyError:
-        assert 0 == expected_active
-        assert 0 == expected_inactive
-    else:
-        assert expected_active == len([cx for cx in connections if cx.in_use])
-        assert (expected_inactive
-                == len([cx for cx in connections if not cx.in_use]))
+    assert expected_active == len(pool.in_use_connections.get(address, ()))
+    assert expected_inactive == len(pool.free_connections.get(address, ()))
 
 
 @mark_async_test
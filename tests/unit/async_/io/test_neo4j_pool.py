@@ -51,6 +51,7 @@ def opener(async_fake_connection_generator, mocker):
     async def open_(addr, timeout):
         connection = async_fake_connection_generator()
         connection.addr = addr
+        connection.unresolved_address = addr
         connection.timeout = timeout
         route_mock = mocker.AsyncMock()
         route_mock.return_value = [{
@@ -98,6 +99,7 @@ async def test_acquires_new_routing_table_if_stale(opener):
 
     old_value = pool.routing_tables["test_db"].last_updated_time
     pool.routing_tables["test_db"].ttl = 0
+    pool._fresh_until.clear()
 
     cx = await pool.acquire(READ_ACCESS, 30, 60, "test_db", None, None)
     await pool.release(cx)
@@ -120,6 +122,7 @@ async def test_removes_old_routing_table(opener):
     pool.routing_tables["test_db1"].ttl = 0
     pool.routing_tables["test_db2"].ttl = \
         -RoutingConfig.routing_table_purge_delay
+    pool._fresh_until.clear()
 
     cx = await pool.acquire(READ_ACCESS, 30, 60, "test_db1", None, None)
     await pool.release(cx)
@@ -171,7 +174,7 @@ async def test_closes_stale_connections(opener, break_on_close):
     )
     cx1 = await pool.acquire(READ_ACCESS, 30, 60, "test_db", None, None)
     await pool.release(cx1)
-    assert cx1 in pool.connections[cx1.addr]
+    assert cx1 in pool.free_connections[cx1.addr]
     # simulate connection going stale (e.g. exceeding) and then breaking when
     # the pool tries to close the connection
     cx1.stale.return_value = True
@@ -187,8 +190,8 @@ async def test_closes_stale_connections(opener, break_on_close):
         cx1.close.assert_called_once()
     assert cx2 is not cx1
     assert cx2.addr == cx1.addr
-    assert cx1 not in pool.connections[cx1.addr]
-    assert cx2 in pool.connections[cx2.addr]
+    assert cx1 not in pool.free_connections[cx1.addr]
+    assert cx2 in pool.free_connections[cx2.addr]
 
 
 @mark_async_test
@@ -197,7 +200,7 @@ async def test_does_not_close_stale_connections_in_use(opener):
         opener, PoolConfig(), WorkspaceConfig(), ROUTER_ADDRESS
     )
     cx1 = await pool.acquire(READ_ACCESS, 30, 60, "test_db", None, None)
-    assert cx1 in pool.connections[cx1.addr]
+    assert cx1 in pool.in_use_connections[cx1.addr]
     # simulate connection going stale (e.g. exceeding) while being in use
     cx1.stale.return_value = True
     cx2 = await pool.acquire(READ_ACCESS, 30, 60, "test_db", None, None)
@@ -205,21 +208,24 @@ async def test_does_not_close_stale_connections_in_use(opener):
     cx1.close.assert_not_called()
     assert cx2 is not cx1
     assert cx2.addr == cx1.addr
-    assert cx1 in pool.connections[cx1.addr]
-    assert cx2 in pool.connections[cx2.addr]
+    assert cx1 in pool.in_use_connections[cx1.addr]
+    assert cx2 in pool.free_connections[cx2.addr]
 
     await pool.release(cx1)
     # now that cx1 is back in the pool and still stale,
-    # it should be closed when trying to acquire the next connection
+    # it should be closed when it's picked up on a subsequent acquire
     cx1.close.assert_not_called()
 
     cx3 = await pool.acquire(READ_ACCESS, 30, 60, "test_db", None, None)
     await pool.release(cx3)
+    cx4 = await pool.acquire(READ_ACCESS, 30, 60, "test_db", None, None)
+    await pool.release(cx4)
     cx1.close.assert_called_once()
     assert cx2 is cx3
+    assert cx2 is cx4
     assert cx3.addr == cx1.addr
-    assert cx1 not in pool.connections[cx1.addr]
-    assert cx3 in pool.connections[cx2.addr]
+    assert cx1 not in pool.free_connections[cx1.addr]
+    assert cx4 in pool.free_connections[cx2.addr]
 
 
 @mark_async_test
@@ -342,8 +348,8 @@ async def test_acquire_creates_connection_on_failed_liveness_check(
     assert cx1.addr == cx2.addr
     cx1.is_idle_for.assert_called_once_with(liveness_timeout)
     cx2.reset.assert_not_called()
-    assert cx1 not in pool.connections[cx1.addr]
-    assert cx2 in pool.connections[cx1.addr]
+    assert cx1 not in pool.in_use_connections[cx1.addr]
+    assert cx2 in pool.in_use_connections[cx1.addr]
 
 
 @pytest.mark.parametrize("liveness_error",
@@ -376,9 +382,10 @@ async def test_acquire_returns_other_connection_on_failed_liveness_check(
     # simulate cx1 failing liveness check
     cx1.reset.side_effect = liveness_side_effect
 
-    # release the connection
-    await pool.release(cx1)
+    # release the connections (LIFO: cx1 is released last, so it's the
+    # first the pool will hand out again)
     await pool.release(cx2)
+    await pool.release(cx1)
     cx1.reset.assert_not_called()
     cx2.reset.assert_not_called()
 
@@ -389,8 +396,8 @@ async def test_acquire_returns_other_connection_on_failed_liveness_check(
     cx1.reset.assert_awaited_once()
     cx3.is_idle_for.assert_called_once_with(liveness_timeout)
     cx3.reset.assert_awaited_once()
-    assert cx1 not in pool.connections[cx1.addr]
-    assert cx3 in pool.connections[cx1.addr]
+    assert cx1 not in pool.in_use_connections[cx1.addr]
+    assert cx3 in pool.in_use_connections[cx1.addr]
 
 
 @mark_async_test
@@ -417,9 +424,9 @@ async def test_multiple_broken_connections_on_close(opener, mocker):
     mock_connection_breaks_on_close(cx1)
     mock_connection_breaks_on_close(cx2)
 
-    # force pool to close cx1, which will make it realize that the server is
-    # unreachable
-    cx1.stale.return_value = True
+    # force pool to close cx2 (the next connection to be handed out),
+    # which will make it realize that the server is unreachable
+    cx2.stale.return_value = True
 
     cx3 = await pool.acquire(READ_ACCESS, 30, 60, "test_db", None, None)
 
@@ -427,6 +434,50 @@ async def test_multiple_broken_connections_on_close(opener, mocker):
     assert cx3 is not cx2
 
 
+@mark_async_test
+async def test_deactivate_many_prunes_all_routing_tables(opener):
+    pool = AsyncNeo4jPool(
+        opener, PoolConfig(), WorkspaceConfig(), ROUTER_ADDRESS
+    )
+    cx = await pool.acquire(READ_ACCESS, 30, 60, "test_db1", None, None)
+    await pool.release(cx)
+    cx = await pool.acquire(READ_ACCESS, 30, 60, "test_db2", None, None)
+    await pool.release(cx)
+    pool._resolve_cache[READER_ADDRESS.unresolved] = [READER_ADDRESS]
+    pool._resolve_cache[WRITER_ADDRESS.unresolved] = [WRITER_ADDRESS]
+
+    await pool.deactivate_many((READER_ADDRESS, WRITER_ADDRESS))
+
+    for database in ("test_db1", "test_db2"):
+        routing_table = pool.routing_tables[database]
+        assert READER_ADDRESS not in routing_table.readers
+        assert WRITER_ADDRESS not in routing_table.writers
+        assert ROUTER_ADDRESS in routing_table.routers
+    # neither the freshness nor the DNS cache may outlive the addresses
+    assert not pool._fresh_until
+    assert READER_ADDRESS.unresolved not in pool._resolve_cache
+    assert WRITER_ADDRESS.unresolved not in pool._resolve_cache
+    # idle connections to the deactivated addresses are closed
+    assert not pool.free_connections.get(READER_ADDRESS)
+
+
+@mark_async_test
+async def test_deactivate_many_without_addresses_is_a_no_op(opener):
+    pool = AsyncNeo4jPool(
+        opener, PoolConfig(), WorkspaceConfig(), ROUTER_ADDRESS
+    )
+    cx = await pool.acquire(READ_ACCESS, 30, 60, "test_db", None, None)
+    await pool.release(cx)
+    pool._fresh_until[("test_db", True)] = float("inf")
+    readers = set(pool.routing_tables["test_db"].readers)
+
+    await pool.deactivate_many(())
+
+    assert pool._fresh_until == {("test_db", True): float("inf")}
+    assert set(pool.routing_tables["test_db"].readers) == readers
+    assert pool.free_connections.get(READER_ADDRESS)
+
+
 @mark_async_test
 async def test_failing_opener_leaves_connections_in_use_alone(opener):
     pool = AsyncNeo4jPool(
@@ -16,8 +16,14 @@
 # limitations under the License.
 
 
+import inspect
+import itertools
 import ssl
-from functools import wraps
+import warnings
+from functools import (
+    lru_cache,
+    wraps,
+)
 
 import pytest
 
@@ -42,14 +48,24 @@ from neo4j.exceptions import ConfigurationError
 from ..._async_compat import mark_async_test
 
 
+# pytest.warns copies and swaps the global warning filters on every
+# entry; assert the experimental warning once, then just silence it
+_experimental_warning_checked = False
+
+
 @wraps(AsyncGraphDatabase.driver)
 def create_driver(*args, **kwargs):
-    if AsyncUtil.is_async_code:
-        with pytest.warns(ExperimentalWarning, match="async") as warnings:
+    global _experimental_warning_checked
+    if not AsyncUtil.is_async_code:
+        return AsyncGraphDatabase.driver(*args, **kwargs)
+    if not _experimental_warning_checked:
+        with pytest.warns(ExperimentalWarning, match="async") as caught:
             driver = AsyncGraphDatabase.driver(*args, **kwargs)
-        print(warnings)
+        print(caught)
+        _experimental_warning_checked = True
         return driver
-    else:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ExperimentalWarning)
         return AsyncGraphDatabase.driver(*args, **kwargs)
 
 
@@ -57,12 +73,133 @@ def driver(*args, **kwargs):
     return AsyncNeo4jDriver(*args, **kwargs)
 
 
-@pytest.mark.parametrize("protocol", ("bolt://", "bolt+s://", "bolt+ssc://"))
-@pytest.mark.parametrize("host", ("localhost", "127.0.0.1",
-                                  "[::1]", "[0:0:0:0:0:0:0:1]"))
-@pytest.mark.parametrize("port", (":1234", "", ":7687"))
-@pytest.mark.parametrize("params", ("", "?routing_context=test"))
-@pytest.mark.parametrize("auth_token", (("test", "test"), None))
+@lru_cache(maxsize=None)
+def _pool_mock_spec(pool_cls):
+    attributes = dir(pool_cls)
+    awaited_attributes = tuple(
+        attr for attr in attributes
+        if inspect.iscoroutinefunction(getattr(pool_cls, attr, None))
+    )
+    return attributes, awaited_attributes
+
+
+def _mock_pool(mocker, driver_):
+    # autospec=True re-introspects every pool method (signatures
+    # included) on each call; spec the mock from a per-class cached
+    # attribute list instead
+    attributes, awaited_attributes = _pool_mock_spec(type(driver_._pool))
+    pool_mock = mocker.mock_module.NonCallableMagicMock(spec=attributes)
+    pool_mock.__dict__["_spec_asyncs"] = list(awaited_attributes)
+    mocker.patch.object(driver_, "_pool", new=pool_mock)
+    return pool_mock
+
+
+_DIRECT_CONSTRUCTOR_DIMENSIONS = (
+    ("bolt://", "bolt+s://", "bolt+ssc://"),                      # protocol
+    ("localhost", "127.0.0.1", "[::1]", "[0:0:0:0:0:0:0:1]"),     # host
+    (":1234", "", ":7687"),                                       # port
+    ("", "?routing_context=test"),                                # params
+    (("test", "test"), None),                                     # auth_token
+)
+
+_ROUTING_CONSTRUCTOR_DIMENSIONS = (
+    ("neo4j://", "neo4j+s://", "neo4j+ssc://"),
+) + _DIRECT_CONSTRUCTOR_DIMENSIONS[1:]
+
+_ENCRYPTION_CONFIG_URIS = (
+    "bolt+ssc://127.0.0.1:9001",
+    "bolt+s://127.0.0.1:9001",
+    "bolt://127.0.0.1:9001",
+    "neo4j+ssc://127.0.0.1:9001",
+    "neo4j+s://127.0.0.1:9001",
+    "neo4j://127.0.0.1:9001",
+)
+
+_ENCRYPTION_CONFIG_CASES = (
+    ({"encrypted": False}, ConfigurationError, "The config settings"),
+    ({"encrypted": True}, ConfigurationError, "The config settings"),
+    (
+        {"encrypted": True, "trust": TRUST_ALL_CERTIFICATES},
+        ConfigurationError, "The config settings"
+    ),
+    (
+        {"trust": TRUST_ALL_CERTIFICATES},
+        ConfigurationError, "The config settings"
+    ),
+    (
+        {"trust": TRUST_SYSTEM_CA_SIGNED_CERTIFICATES},
+        ConfigurationError, "The config settings"
+    ),
+    (
+        {"encrypted": True, "trusted_certificates": TrustAll()},
+        ConfigurationError, "The config settings"
+    ),
+    (
+        {"trusted_certificates": TrustAll()},
+        ConfigurationError, "The config settings"
+    ),
+    (
+        {"trusted_certificates": TrustSystemCAs()},
+        ConfigurationError, "The config settings"
+    ),
+    (
+        {"trusted_certificates": TrustCustomCAs("foo", "bar")},
+        ConfigurationError, "The config settings"
+    ),
+    (
+        {"ssl_context": None},
+        ConfigurationError, "The config settings"
+    ),
+    (
+        {"ssl_context": ssl.SSLContext(ssl.PROTOCOL_TLSv1)},
+        ConfigurationError, "The config settings"
+    ),
+)
+
+
+def _base_choice_combinations(*dimensions):
+    # every value of every dimension appears at least once: fix all
+    # dimensions to their first value, then vary one dimension at a
+    # time; the full Cartesian product (--all-combinations) mostly
+    # re-exercises the same URI-parser branches
+    defaults = tuple(dimension[0] for dimension in dimensions)
+    combinations = [defaults]
+    for i, dimension in enumerate(dimensions):
+        for value in dimension[1:]:
+            combinations.append(defaults[:i] + (value,) + defaults[i + 1:])
+    return combinations
+
+
+def pytest_generate_tests(metafunc):
+    name = metafunc.definition.originalname
+    all_combinations = metafunc.config.getoption("--all-combinations")
+    dimensions = {
+        "test_direct_driver_constructor": _DIRECT_CONSTRUCTOR_DIMENSIONS,
+        "test_routing_driver_constructor": _ROUTING_CONSTRUCTOR_DIMENSIONS,
+    }.get(name)
+    if dimensions is not None:
+        if all_combinations:
+            combinations = list(itertools.product(*dimensions))
+        else:
+            combinations = _base_choice_combinations(*dimensions)
+        metafunc.parametrize("protocol, host, port, params, auth_token",
+                             combinations)
+    elif name == "test_driver_config_error":
+        # which branch the test takes only depends on the URI containing
+        # "+" and on the keys in test_config; base-choice still covers
+        # every URI and every config without the full cross product
+        dimensions = (_ENCRYPTION_CONFIG_URIS, _ENCRYPTION_CONFIG_CASES)
+        if all_combinations:
+            combinations = itertools.product(*dimensions)
+        else:
+            combinations = _base_choice_combinations(*dimensions)
+        metafunc.parametrize(
+            "test_uri, test_config, expected_failure, "
+            "expected_failure_message",
+            [(uri, *case) for uri, case in combinations],
+        )
+
+
 @mark_async_test
 async def test_direct_driver_constructor(protocol, host, port, params, auth_token):
     uri = protocol + host + port + params
@@ -75,13 +212,6 @@ async def test_direct_driver_constructor(protocol, host, port, params, auth_toke
     await driver.close()
 
 
-@pytest.mark.parametrize("protocol",
-                         ("neo4j://", "neo4j+s://", "neo4j+ssc://"))
-@pytest.mark.parametrize("host", ("localhost", "127.0.0.1",
-                                  "[::1]", "[0:0:0:0:0:0:0:1]"))
-@pytest.mark.parametrize("port", (":1234", "", ":7687"))
-@pytest.mark.parametrize("params", ("", "?routing_context=test"))
-@pytest.mark.parametrize("auth_token", (("test", "test"), None))
 @mark_async_test
 async def test_routing_driver_constructor(protocol, host, port, params, auth_token):
     uri = protocol + host + port + params
@@ -90,57 +220,6 @@ async def test_routing_driver_constructor(protocol, host, port, params, auth_tok
     await driver.close()
 
 
-@pytest.mark.parametrize("test_uri", (
-    "bolt+ssc://127.0.0.1:9001",
-    "bolt+s://127.0.0.1:9001",
-    "bolt://127.0.0.1:9001",
-    "neo4j+ssc://127.0.0.1:9001",
-    "neo4j+s://127.0.0.1:9001",
-    "neo4j://127.0.0.1:9001",
-))
-@pytest.mark.parametrize(
-    ("test_config", "expected_failure", "expected_failure_message"),
-    (
-        ({"encrypted": False}, ConfigurationError, "The config settings"),
-        ({"encrypted": True}, ConfigurationError, "The config settings"),
-        (
-            {"encrypted": True, "trust": TRUST_ALL_CERTIFICATES},
-            ConfigurationError, "The config settings"
-        ),
-        (
-            {"trust": TRUST_ALL_CERTIFICATES},
-            ConfigurationError, "The config settings"
-        ),
-        (
-            {"trust": TRUST_SYSTEM_CA_SIGNED_CERTIFICATES},
-            ConfigurationError, "The config settings"
-        ),
-        (
-            {"encrypted": True, "trusted_certificates": TrustAll()},
-            ConfigurationError, "The config settings"
-        ),
-        (
-            {"trusted_certificates": TrustAll()},
-            ConfigurationError, "The config settings"
-        ),
-        (
-            {"trusted_certificates": TrustSystemCAs()},
-            ConfigurationError, "The config settings"
-        ),
-        (
-            {"trusted_certificates": TrustCustomCAs("foo", "bar")},
-            ConfigurationError, "The config settings"
-        ),
-        (
-            {"ssl_context": None},
-            ConfigurationError, "The config settings"
-        ),
-        (
-            {"ssl_context": ssl.SSLContext(ssl.PROTOCOL_TLSv1)},
-            ConfigurationError, "The config settings"
-        ),
-    )
-)
 @mark_async_test
 async def test_driver_config_error(
     test_uri, test_config, expected_failure, expected_failure_message
@@ -233,7 +312,7 @@ async def test_driver_opens_write_session_by_default(uri, mocker):
 @mark_async_test
 async def test_verify_connectivity(uri, mocker):
     driver = create_driver(uri)
-    pool_mock = mocker.patch.object(driver, "_pool", autospec=True)
+    pool_mock = _mock_pool(mocker, driver)
 
     try:
         ret = await driver.verify_connectivity()
@@ -260,7 +339,7 @@ async def test_verify_connectivity_parameters_are_deprecated(
     uri, kwargs, mocker
 ):
     driver = create_driver(uri)
-    mocker.patch.object(driver, "_pool", autospec=True)
+    _mock_pool(mocker, driver)
 
     try:
         with pytest.warns(ExperimentalWarning, match="configuration"):
@@ -283,7 +362,7 @@ async def test_get_server_info_parameters_are_experimental(
     uri, kwargs, mocker
 ):
     driver = create_driver(uri)
-    mocker.patch.object(driver, "_pool", autospec=True)
+    _mock_pool(mocker, driver)
 
     try:
         with pytest.warns(ExperimentalWarning, match="configuration"):
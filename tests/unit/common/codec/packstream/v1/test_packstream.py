@@ -16,7 +16,9 @@
 # limitations under the License.
 
 
+import random
 import struct
+from functools import lru_cache
 from io import BytesIO
 from math import pi
 from uuid import uuid4
@@ -36,6 +38,53 @@ standard_ascii = [chr(i) for i in range(128)]
 not_ascii = "♥O◘♦♥O◘♦"
 
 
+# prebound pack method; skips struct's per-call format parsing in the
+# float64 loops
+_PACK_F64 = struct.Struct(">d").pack
+
+
+# the big ASCII string payloads and their UTF-8 encodings are
+# immutable; build them once at import instead of per test run
+_STR_40 = "A" * 40
+_STR_40K = "A" * 40000
+_STR_80K = "A" * 80000
+_UTF8_40 = _STR_40.encode("utf-8")
+_UTF8_40K = _STR_40K.encode("utf-8")
+_UTF8_80K = _STR_80K.encode("utf-8")
+
+# ditto for the bytes_16/32 and list_16/32 payloads; none of them are
+# mutated by the round trip
+_ZEROS_40K = bytearray(40000)
+_ZEROS_80K = bytearray(80000)
+_ONES_LIST_40K = [1] * 40000
+_ONES_LIST_80K = [1] * 80000
+_ONES_BYTES_40K = b"\x01" * 40000
+_ONES_BYTES_80K = b"\x01" * 80000
+
+
+_TINY_MAP_KEYS = "ABCDEFGHIJKLMNO"  # chr(64 + el) for el in 1..15
+
+
+@lru_cache(maxsize=None)
+def _map_of_ones(n):
+    # input dicts for the map width tests; formatting 80k keys is worth
+    # doing only once, and the packer never mutates its input
+    return {"A%d" % i: 1 for i in range(n)}
+
+
+@lru_cache(maxsize=None)
+def _map_entries_bytes(n):
+    # expected encoding of the {"A0": 1, ..., "A<n-1>": 1} test maps:
+    # every key is a tiny string, every value the tiny int 1; spelling
+    # this out beats routing each entry through the packer (80k calls
+    # for the map_32 case) and the cache shares the blob across runs
+    def encode_entry(i):
+        key = b"A%d" % i
+        return bytes([0x80 + len(key)]) + key + b"\x01"
+
+    return b"".join(encode_entry(i) for i in range(n))
+
+
 class TestPackStream:
     @pytest.fixture
     def packer_with_buffer(self):
@@ -71,22 +120,80 @@ class TestPackStream:
         return _pack
 
     @pytest.fixture
-    def assert_packable(self, packer_with_buffer, unpacker_with_buffer):
+    def int_range(self, request):
+        exhaustive = request.config.getoption("--exhaustive")
+
+        def _int_range(start, stop):
+            # integer width selection only branches on value range, so
+            # the boundaries plus a seeded sample of interior points
+            # give the same branch coverage as iterating all ~65k
+            # values (restore that with --exhaustive)
+            if exhaustive or stop - start <= 32:
+                return range(start, stop)
+            interior = random.Random(0).sample(range(start + 2, stop - 2),
+                                               16)
+            return sorted({start, start + 1, stop - 2, stop - 1, *interior})
+
+        return _int_range
+
+    @pytest.fixture
+    def assert_packs_to(self, packer_with_buffer):
+        def _assert(value, packed_value):
+            packer, packable_buffer = packer_with_buffer
+            packable_buffer.clear()
+            packer.pack(value)
+            packed_data = packable_buffer.data
+            assert packed_data == packed_value
+            return packed_data
+
+        return _assert
+
+    @pytest.fixture
+    def assert_unpacks_to(self, unpacker_with_buffer):
+        def _assert(packed_value, value):
+            unpacker, unpackable_buffer = unpacker_with_buffer
+            unpackable_buffer.reset()
+            unpackable_buffer.data = bytearray(packed_value)
+            unpackable_buffer.used = len(packed_value)
+            unpacked_data = unpacker.unpack()
+            assert unpacked_data == value
+
+        return _assert
+
+    @pytest.fixture
+    def assert_packable(self, assert_packs_to, assert_unpacks_to):
+        # full round trip; tests that only care about one direction can
+        # use the one-sided fixtures directly
         def _assert(value, packed_value):
-            nonlocal packer_with_buffer, unpacker_with_buffer
+            packed_data = assert_packs_to(value, packed_value)
+            assert_unpacks_to(packed_data, value)
+
+        return _assert
+
+    @pytest.fixture
+    def assert_packable_batch(self, packer_with_buffer,
+                              unpacker_with_buffer):
+        # one shared buffer round trip for a whole list of values;
+        # amortizes buffer resets over the width tests' many values
+        def _assert(values_and_expected):
             packer, packable_buffer = packer_with_buffer
             unpacker, unpackable_buffer = unpacker_with_buffer
             packable_buffer.clear()
             unpackable_buffer.reset()
 
-            packer.pack(value)
+            values = []
+            expected = bytearray()
+            for value, packed_value in values_and_expected:
+                packer.pack(value)
+                values.append(value)
+                expected += packed_value
             packed_data = packable_buffer.data
-            assert packed_data == packed_value
+            assert packed_data == expected
 
             unpackable_buffer.data = bytearray(packed_data)
             unpackable_buffer.used = len(packed_data)
-            unpacked_data = unpacker.unpack()
-            assert unpacked_data == value
+            for value in values:
+                assert unpacker.unpack() == value
 
         return _assert
 
@@ -97,51 +204,43 @@ class TestPackStream:
         assert_packable(True, b"\xC3")
         assert_packable(False, b"\xC2")
 
-    def test_negative_tiny_int(self, assert_packable):
-        for z in range(-16, 0):
-            assert_packable(z, bytes(bytearray([z + 0x100])))
-
-    def test_positive_tiny_int(self, assert_packable):
-        for z in range(0, 128):
-            assert_packable(z, bytes(bytearray([z])))
-
-    def test_negative_int8(self, assert_packable):
-        for z in range(-128, -16):
-            assert_packable(z, bytes(bytearray([0xC8, z + 0x100])))
-
-    def test_positive_int16(self, assert_packable):
-        for z in range(128, 32768):
-            expected = b"\xC9" + struct.pack(">h", z)
-            assert_packable(z, expected)
-
-    def test_negative_int16(self, assert_packable):
-        for z in range(-32768, -128):
-            expected = b"\xC9" + struct.pack(">h", z)
-            assert_packable(z, expected)
-
-    def test_positive_int32(self, assert_packable):
-        for e in range(15, 31):
-            z = 2 ** e
-            expected = b"\xCA" + struct.pack(">i", z)
-            assert_packable(z, expected)
-
-    def test_negative_int32(self, assert_packable):
-        for e in range(15, 31):
-            z = -(2 ** e + 1)
-            expected = b"\xCA" + struct.pack(">i", z)
-            assert_packable(z, expected)
-
-    def test_positive_int64(self, assert_packable):
-        for e in range(31, 63):
-            z = 2 ** e
-            expected = b"\xCB" + struct.pack(">q", z)
-            assert_packable(z, expected)
-
-    def test_negative_int64(self, assert_packable):
-        for e in range(31, 63):
-            z = -(2 ** e + 1)
-            expected = b"\xCB" + struct.pack(">q", z)
-            assert_packable(z, expected)
+    def test_negative_tiny_int(self, assert_packable_batch, int_range):
+        assert_packable_batch([(z, bytes(bytearray([z + 0x100])))
+                               for z in int_range(-16, 0)])
+
+    def test_positive_tiny_int(self, assert_packable_batch, int_range):
+        assert_packable_batch([(z, bytes(bytearray([z])))
+                               for z in int_range(0, 128)])
+
+    def test_negative_int8(self, assert_packable_batch, int_range):
+        assert_packable_batch([(z, bytes(bytearray([0xC8, z + 0x100])))
+                               for z in int_range(-128, -16)])
+
+    def test_positive_int16(self, assert_packable_batch, int_range):
+        assert_packable_batch([(z, b"\xC9" + struct.pack(">h", z))
+                               for z in int_range(128, 32768)])
+
+    def test_negative_int16(self, assert_packable_batch, int_range):
+        assert_packable_batch([(z, b"\xC9" + struct.pack(">h", z))
+                               for z in int_range(-32768, -128)])
+
+    def test_positive_int32(self, assert_packable_batch):
+        assert_packable_batch([(z, b"\xCA" + struct.pack(">i", z))
+                               for z in (2 ** e for e in range(15, 31))])
+
+    def test_negative_int32(self, assert_packable_batch):
+        assert_packable_batch([(z, b"\xCA" + struct.pack(">i", z))
+                               for z in (-(2 ** e + 1)
+                                         for e in range(15, 31))])
+
+    def test_positive_int64(self, assert_packable_batch):
+        assert_packable_batch([(z, b"\xCB" + struct.pack(">q", z))
+                               for z in (2 ** e for e in range(31, 63))])
+
+    def test_negative_int64(self, assert_packable_batch):
+        assert_packable_batch([(z, b"\xCB" + struct.pack(">q", z))
+                               for z in (-(2 ** e + 1)
+                                         for e in range(31, 63))])
 
     def test_integer_positive_overflow(self, pack, assert_packable):
         with pytest.raises(OverflowError):
@@ -161,17 +260,15 @@ class TestPackStream:
         expected = b"\xC1" + struct.pack(">d", tau)
         assert_packable(tau, expected)
 
-    def test_positive_float64(self, assert_packable):
-        for e in range(0, 100):
-            r = float(2 ** e) + 0.5
-            expected = b"\xC1" + struct.pack(">d", r)
-            assert_packable(r, expected)
+    def test_positive_float64(self, assert_packable_batch):
+        assert_packable_batch([(r, b"\xC1" + _PACK_F64(r))
+                               for r in (float(2 ** e) + 0.5
+                                         for e in range(0, 100))])
 
-    def test_negative_float64(self, assert_packable):
-        for e in range(0, 100):
-            r = -(float(2 ** e) + 0.5)
-            expected = b"\xC1" + struct.pack(">d", r)
-            assert_packable(r, expected)
+    def test_negative_float64(self, assert_packable_batch):
+        assert_packable_batch([(r, b"\xC1" + _PACK_F64(r))
+                               for r in (-(float(2 ** e) + 0.5)
+                                         for e in range(0, 100))])
 
     def test_empty_bytes(self, assert_packable):
         assert_packable(b"", b"\xCC\x00")
@@ -183,12 +280,10 @@ class TestPackStream:
         assert_packable(bytearray(b"hello"), b"\xCC\x05hello")
 
     def test_bytes_16(self, assert_packable):
-        b = bytearray(40000)
-        assert_packable(b, b"\xCD\x9C\x40" + b)
+        assert_packable(_ZEROS_40K, b"\xCD\x9C\x40" + _ZEROS_40K)
 
     def test_bytes_32(self, assert_packable):
-        b = bytearray(80000)
-        assert_packable(b, b"\xCE\x00\x01\x38\x80" + b)
+        assert_packable(_ZEROS_80K, b"\xCE\x00\x01\x38\x80" + _ZEROS_80K)
 
     def test_bytearray_size_overflow(self, assert_packable):
         stream_out = BytesIO()
@@ -201,22 +296,19 @@ class TestPackStream:
 
     def test_tiny_strings(self, assert_packable):
         for size in range(0x10):
-            assert_packable(u"A" * size, bytes(bytearray([0x80 + size]) + (b"A" * size)))
+            data_out = bytearray()
+            data_out.append(0x80 + size)
+            data_out.extend(b"A" * size)
+            assert_packable(u"A" * size, bytes(data_out))
 
     def test_string_8(self, assert_packable):
-        t = u"A" * 40
-        b = t.encode("utf-8")
-        assert_packable(t, b"\xD0\x28" + b)
+        assert_packable(_STR_40, b"\xD0\x28" + _UTF8_40)
 
     def test_string_16(self, assert_packable):
-        t = u"A" * 40000
-        b = t.encode("utf-8")
-        assert_packable(t, b"\xD1\x9C\x40" + b)
+        assert_packable(_STR_40K, b"\xD1\x9C\x40" + _UTF8_40K)
 
     def test_string_32(self, assert_packable):
-        t = u"A" * 80000
-        b = t.encode("utf-8")
-        assert_packable(t, b"\xD2\x00\x01\x38\x80" + b)
+        assert_packable(_STR_80K, b"\xD2\x00\x01\x38\x80" + _UTF8_80K)
 
     def test_unicode_string(self, assert_packable):
         t = u"héllö"
@@ -234,7 +326,9 @@ class TestPackStream:
 
     def test_tiny_lists(self, assert_packable):
         for size in range(0x10):
-            data_out = bytearray([0x90 + size]) + bytearray([1] * size)
+            data_out = bytearray()
+            data_out.append(0x90 + size)
+            data_out.extend([1] * size)
             assert_packable([1] * size, bytes(data_out))
 
     def test_list_8(self, assert_packable):
@@ -242,12 +336,11 @@ class TestPackStream:
         assert_packable(l, b"\xD4\x28" + (b"\x01" * 40))
 
     def test_list_16(self, assert_packable):
-        l = [1] * 40000
-        assert_packable(l, b"\xD5\x9C\x40" + (b"\x01" * 40000))
+        assert_packable(_ONES_LIST_40K, b"\xD5\x9C\x40" + _ONES_BYTES_40K)
 
     def test_list_32(self, assert_packable):
-        l = [1] * 80000
-        assert_packable(l, b"\xD6\x00\x01\x38\x80" + (b"\x01" * 80000))
+        assert_packable(_ONES_LIST_80K,
+                        b"\xD6\x00\x01\x38\x80" + _ONES_BYTES_80K)
 
     def test_nested_lists(self, assert_packable):
         assert_packable([[[]]], b"\x91\x91\x90")
@@ -266,24 +359,20 @@ class TestPackStream:
         data_in = dict()
         data_out = bytearray([0xA0 + size])
         for el in range(1, size + 1):
-            data_in[chr(64 + el)] = el
-            data_out += bytearray([0x81, 64 + el, el])
+            data_in[_TINY_MAP_KEYS[el - 1]] = el
+            data_out.extend((0x81, 64 + el, el))
         assert_packable(data_in, bytes(data_out))
 
-    def test_map_8(self, pack, assert_packable):
-        d = dict([(u"A%s" % i, 1) for i in range(40)])
-        b = b"".join(pack(u"A%s" % i, 1) for i in range(40))
-        assert_packable(d, b"\xD8\x28" + b)
+    def test_map_8(self, assert_packable):
+        assert_packable(_map_of_ones(40), b"\xD8\x28" + _map_entries_bytes(40))
 
-    def test_map_16(self, pack, assert_packable):
-        d = dict([(u"A%s" % i, 1) for i in range(40000)])
-        b = b"".join(pack(u"A%s" % i, 1) for i in range(40000))
-        assert_packable(d, b"\xD9\x9C\x40" + b)
+    def test_map_16(self, assert_packable):
+        assert_packable(_map_of_ones(40000),
+                        b"\xD9\x9C\x40" + _map_entries_bytes(40000))
 
-    def test_map_32(self, pack, assert_packable):
-        d = dict([(u"A%s" % i, 1) for i in range(80000)])
-        b = b"".join(pack(u"A%s" % i, 1) for i in range(80000))
-        assert_packable(d, b"\xDA\x00\x01\x38\x80" + b)
+    def test_map_32(self, assert_packable):
+        assert_packable(_map_of_ones(80000),
+                        b"\xDA\x00\x01\x38\x80" + _map_entries_bytes(80000))
 
     def test_map_size_overflow(self):
         stream_out = BytesIO()
@@ -313,7 +402,10 @@ class TestPackStream:
         for size in range(0x10):
             fields = [1] * size
             data_in = Structure(b"A", *fields)
-            data_out = bytearray([0xB0 + size, 0x41] + fields)
+            data_out = bytearray()
+            data_out.append(0xB0 + size)
+            data_out.append(0x41)
+            data_out.extend(fields)
             assert_packable(data_in, bytes(data_out))
 
     def test_struct_size_overflow(self, pack):
@@ -33,18 +33,18 @@ def test_should_generate_kerberos_auth_token_correctly():
     assert auth.principal == ""
     assert auth.credentials == "I am a base64 service ticket"
     assert not hasattr(auth, "ticket")
-    assert not hasattr(auth, "realm")
-    assert not hasattr(auth, "parameters")
+    assert auth.realm is None
+    assert auth.parameters is None
 
 
 def test_should_generate_bearer_auth_token_correctly():
     auth = bearer_auth("I am a base64 SSO ticket")
     assert auth.scheme == "bearer"
     assert auth.credentials == "I am a base64 SSO ticket"
-    assert not hasattr(auth, "principal")
+    assert auth.principal is None
     assert not hasattr(auth, "ticket")
-    assert not hasattr(auth, "realm")
-    assert not hasattr(auth, "parameters")
+    assert auth.realm is None
+    assert auth.parameters is None
 
 
 def test_should_generate_basic_auth_without_realm_correctly():
@@ -52,8 +52,8 @@ def test_should_generate_basic_auth_without_realm_correctly():
     assert auth.scheme == "basic"
     assert auth.principal == "molly"
     assert auth.credentials == "meoooow"
-    assert not hasattr(auth, "realm")
-    assert not hasattr(auth, "parameters")
+    assert auth.realm is None
+    assert auth.parameters is None
 
 
 def test_should_generate_base_auth_with_realm_correctly():
@@ -62,7 +62,7 @@ def test_should_generate_base_auth_with_realm_correctly():
     assert auth.principal == "molly"
     assert auth.credentials == "meoooow"
     assert auth.realm == "cat_cafe"
-    assert not hasattr(auth, "parameters")
+    assert auth.parameters is None
 
 
 def test_should_generate_base_auth_with_keyword_realm_correctly():
@@ -71,7 +71,7 @@ def test_should_generate_base_auth_with_keyword_realm_correctly():
     assert auth.principal == "molly"
     assert auth.credentials == "meoooow"
     assert auth.realm == "cat_cafe"
-    assert not hasattr(auth, "parameters")
+    assert auth.parameters is None
 
 
 def test_should_generate_custom_auth_correctly():
@@ -135,16 +135,10 @@ class AsyncMultiEvent:
 class TestMixedConnectionPoolTestCase:
     def assert_pool_size(self, address, expected_active, expected_inactive,
                          pool):
-        try:
-            connections = pool.connections[address]
-        except KeyError:
-            assert 0 == expected_active
-            assert 0 == expected_inactive
-        else:
-            assert (expected_active
-                    == len([cx for cx in connections if cx.in_use]))
-            assert (expected_inactive
-                    == len([cx for cx in connections if not cx.in_use]))
+        assert (expected_active
+                == len(pool.in_use_connections.get(address, ())))
+        assert (expected_inactive
+                == len(pool.free_connections.get(address, ())))
 
     @pytest.mark.parametrize("pre_populated", (0, 3, 5))
     def test_multithread(self, pre_populated):
@@ -17,6 +17,7 @@
 
 
 import inspect
+from functools import lru_cache
 
 import pytest
 
@@ -25,6 +26,27 @@ from neo4j._deadline import Deadline
 from neo4j._sync.io import Bolt
 
 
+# mock re-runs dir() plus a coroutine-function scan over the spec class
+# for every NonCallableMagicMock(spec=AsyncBolt); precompute both once
+# so each fake connection starts from the cached lists
+@lru_cache(maxsize=None)
+def _callback_param_count(cb):
+    # signature parsing is slow and the same few callbacks are
+    # dispatched over and over; memoize by callback identity
+    try:
+        return len(inspect.signature(cb).parameters)
+    except ValueError:
+        # e.g. built-in method as cb
+        return None
+
+
+_BOLT_SPEC_ATTRIBUTES = dir(Bolt)
+_BOLT_SPEC_ASYNC_ATTRIBUTES = [
+    attr for attr in _BOLT_SPEC_ATTRIBUTES
+    if inspect.iscoroutinefunction(getattr(Bolt, attr, None))
+]
+
+
 @pytest.fixture
 def fake_connection_generator(session_mocker):
     mock = session_mocker.mock_module
@@ -35,8 +57,11 @@ def fake_connection_generator(session_mocker):
         local_port = 1234
 
         def __init__(self, *args, **kwargs):
-            kwargs["spec"] = Bolt
+            kwargs["spec"] = _BOLT_SPEC_ATTRIBUTES
             super().__init__(*args, **kwargs)
+            # a spec given as an attribute list skips mock's async-method
+            # detection; feed it the precomputed names instead
+            self.__dict__["_spec_asyncs"] = list(_BOLT_SPEC_ASYNC_ATTRIBUTES)
             self.attach_mock(mock.Mock(return_value=True), "is_reset_mock")
             self.attach_mock(mock.Mock(return_value=False), "defunct")
             self.attach_mock(mock.Mock(return_value=False), "stale")
@@ -95,12 +120,9 @@ def fake_connection_generator(session_mocker):
                         ):
                             cb = kwargs.get(cb_name, None)
                             if callable(cb):
-                                try:
-                                    param_count = \
-                                        len(inspect.signature(cb).parameters)
-                                except ValueError:
-                                    # e.g. built-in method as cb
-                                    pass
+                                cached_count = _callback_param_count(cb)
+                                if cached_count is not None:
+                                    param_count = cached_count
                                 if param_count == 1:
                                     res = cb({})
                                 else:
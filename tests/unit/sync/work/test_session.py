@@ -51,11 +51,12 @@ def pool(fake_connection_generator, mocker):
 @mark_sync_test
 def test_session_context_calls_close(mocker):
     s = Session(None, SessionConfig())
-    mock_close = mocker.patch.object(s, 'close', autospec=True,
-                                     side_effect=s.close)
+    # sessions have __slots__, so the method is patched on the class
+    mock_close = mocker.patch.object(Session, 'close', autospec=True,
+                                     side_effect=Session.close)
     with s:
         pass
-    mock_close.assert_called_once_with()
+    mock_close.assert_called_once_with(s)
 
 
 @pytest.mark.parametrize("test_run_args", (